@@ -12,6 +12,7 @@ import logging
 from ai.chains.trade_advisor import build_trade_advisor_agent
 from ai.chains.ai_desk import build_ai_desk_agent
 from ai.llm.openai_client import OpenAIClient
+from langchain_core.messages import AIMessageChunk
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from .storage.db_access import DatabaseAccess
 
@@ -167,28 +168,51 @@ def evaluate_trade(signal_context: dict, signal_id: int) -> dict:
         return None, None
 
 
-def chat(user_query: str, enable_web_search: bool, ai_persona_name: str) -> str:
+_DESK_RUN_CONFIG = {
+    "configurable": {"thread_id": "ai_desk_thread"},
+    "tags": ["ui", "ai_desk"],
+}
+_DESK_ERROR_MESSAGE = (
+    "Sorry, I encountered an error while processing your request. "
+    "Please try again."
+)
+
+
+def _desk_messages(user_query: str, history: list[dict] | None) -> list[dict]:
+    """Prepend prior role/content turns to the new user message."""
+    messages = [
+        {"role": message["role"], "content": message["content"]}
+        for message in history or []
+    ]
+    messages.append({"role": "user", "content": user_query})
+    return messages
+
+
+def _build_desk_agent(enable_web_search: bool, ai_persona_name: str):
     """
-    Chat with the AI desk agent for cryptocurrency market research and analysis.
+    Resolve the persona's LLM settings and build the AI desk agent.
 
     Parameters
     ----------
-        user_query: User's question or request for market analysis
-        enable_web_search: Boolean flag to enable web search tools
-        ai_persona_name: Name of the AI persona to use for the agent
-
-    Returns:
-        String containing the AI desk agent's response
+    enable_web_search : bool
+        Flag to enable web search tools.
+    ai_persona_name : str
+        Name of the AI persona to use for the agent.
+
+    Returns
+    -------
+    tuple
+        (agent, None) on success, or (None, apology message) when the persona
+        or the agent cannot be set up. Failures are logged here.
     """
-
     try:
         ai_persona = get_persona_by_name(ai_persona_name)
         if not ai_persona:
             logging.error(f"Persona '{ai_persona_name}' not found")
-            return (
+            return None, (
                 "Sorry, I'm experiencing technical difficulties with "
-                + "my persona configuration.",
-            ), []
+                "my persona configuration."
+            )
 
         persona_llm_config = ai_persona["llm_parameters"]
         settings = {
@@ -197,9 +221,9 @@ def chat(user_query: str, enable_web_search: bool, ai_persona_name: str) -> str:
         }
     except Exception as e:
         logging.error(f"Failed to get persona config: {e}")
-        return (
-            "Sorry, I'm experiencing technical difficulties with my configuration.",
-        ), []
+        return None, (
+            "Sorry, I'm experiencing technical difficulties with my configuration."
+        )
 
     try:
         llm = LLM_CLIENT.get_llm(settings)
@@ -209,20 +233,42 @@ def chat(user_query: str, enable_web_search: bool, ai_persona_name: str) -> str:
             enable_web_search=enable_web_search,
             enable_middleware=True,
         )
+    except Exception as e:
+        logging.error(f"AI Desk chat failed: {e}")
+        return None, _DESK_ERROR_MESSAGE
+    return ai_desk_agent, None
+
+
+def chat(
+    user_query: str,
+    enable_web_search: bool,
+    ai_persona_name: str,
+    history: list[dict] | None = None,
+) -> str:
+    """
+    Chat with the AI desk agent for cryptocurrency market research and analysis.
+
+    Parameters
+    ----------
+        user_query: User's question or request for market analysis
+        enable_web_search: Boolean flag to enable web search tools
+        ai_persona_name: Name of the AI persona to use for the agent
+        history: Earlier chat messages (dicts with role and content) to send
+            as context, oldest first
 
+    Returns:
+        String containing the AI desk agent's response
+    """
+    ai_desk_agent, error_message = _build_desk_agent(
+        enable_web_search, ai_persona_name
+    )
+    if ai_desk_agent is None:
+        return error_message, []
+
+    try:
         result = ai_desk_agent.invoke(
-            {
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": user_query,
-                    }
-                ]
-            },
-            config={
-                "configurable": {"thread_id": "ai_desk_thread"},
-                "tags": ["ui", "ai_desk"],
-            },
+            {"messages": _desk_messages(user_query, history)},
+            config=_DESK_RUN_CONFIG,
         )
 
         logging.info(f"AI Desk Agent query: {user_query}")
@@ -262,7 +308,72 @@ def chat(user_query: str, enable_web_search: bool, ai_persona_name: str) -> str:
 
     except Exception as e:
         logging.error(f"AI Desk chat failed: {e}")
-        return (
-            "Sorry, I encountered an error while processing your request. "
-            + "Please try again."
-        ), []
+        return _DESK_ERROR_MESSAGE, []
+
+
+def stream_chat(
+    user_query: str,
+    enable_web_search: bool,
+    ai_persona_name: str,
+    tools_used: list | None = None,
+    history: list[dict] | None = None,
+):
+    """
+    Stream the AI desk agent's response as it is generated.
+
+    Parameters
+    ----------
+    user_query : str
+        User's question or request for market analysis.
+    enable_web_search : bool
+        Flag to enable web search tools.
+    ai_persona_name : str
+        Name of the AI persona to use for the agent.
+    tools_used : list, optional
+        Names of the tools the agent calls are appended to this list.
+    history : list of dict, optional
+        Earlier chat messages (role and content) to send as context, oldest
+        first.
+
+    Yields
+    ------
+    str
+        Response text deltas, in order. On failure a single apology message
+        is yielded instead.
+    """
+    ai_desk_agent, error_message = _build_desk_agent(
+        enable_web_search, ai_persona_name
+    )
+    if ai_desk_agent is None:
+        yield error_message
+        return
+
+    if tools_used is None:
+        tools_used = []
+    produced = False
+    try:
+        logging.info(f"AI Desk Agent query: {user_query}")
+
+        for chunk, _metadata in ai_desk_agent.stream(
+            {"messages": _desk_messages(user_query, history)},
+            config=_DESK_RUN_CONFIG,
+            stream_mode="messages",
+        ):
+            if not isinstance(chunk, AIMessageChunk):
+                continue
+            tools_used.extend(
+                tool_call["name"]
+                for tool_call in chunk.tool_call_chunks
+                if tool_call.get("name")
+            )
+            if isinstance(chunk.content, str) and chunk.content:
+                produced = True
+                yield chunk.content
+
+        logging.info(f"Tools used during research: {tools_used}")
+        if not produced:
+            yield "Sorry, I couldn't generate a response."
+
+    except Exception as e:
+        logging.error(f"AI Desk chat failed: {e}")
+        yield _DESK_ERROR_MESSAGE
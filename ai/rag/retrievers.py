@@ -13,6 +13,8 @@ Key capabilities:
 """
 
 from __future__ import annotations
+import os
+from functools import lru_cache
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_core.runnables import RunnableLambda
@@ -32,25 +34,40 @@ def get_embeddings() -> OpenAIEmbeddings:
     return OpenAIEmbeddings()
 
 
-def load_vectorstore(index_path: str) -> FAISS:
+@lru_cache(maxsize=4)
+def _load_vectorstore(index_path: str, mtime: float) -> FAISS:
+    """Read the index from disk; `mtime` is part of the cache key so saves reload."""
+    return FAISS.load_local(
+        index_path,
+        get_embeddings(),
+        allow_dangerous_deserialization=True,
+    )
+
+
+def load_vectorstore(index_path: str, reload: bool = False) -> FAISS:
     """
     Load FAISS vector store from disk.
 
+    The loaded store is cached per index path and reused until the index file
+    is rewritten (e.g. after documents are added), so reruns and repeated
+    searches do not deserialize it again.
+
     Parameters
     ----------
     index_path : str
         Path to the FAISS index directory
+    reload : bool, default False
+        Drop every cached store and read the index from disk again
 
     Returns
     -------
     FAISS
         Loaded FAISS vector store instance
     """
-    return FAISS.load_local(
-        index_path,
-        get_embeddings(),
-        allow_dangerous_deserialization=True,
-    )
+    if reload:
+        _load_vectorstore.cache_clear()
+    mtime = os.path.getmtime(os.path.join(index_path, "index.faiss"))
+    return _load_vectorstore(index_path, mtime)
 
 
 def get_semantic_retriever(index_path: str, k: int = 4) -> VectorStoreRetriever:
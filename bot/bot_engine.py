@@ -8,6 +8,7 @@ and order monitoring.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from ai.ai_agent import evaluate_trade
@@ -34,6 +35,103 @@ class BotEngine:
         self.order_monitor = order_monitor
         self.broker = broker
 
+    def evaluate_symbol(self, symbol, hour):
+        """
+        Fetch candles for a symbol and evaluate its EMA crossover signal.
+
+        This only reads market data, so it is safe to run for several
+        symbols concurrently.
+
+        Parameters
+        ----------
+        symbol : str
+            Trading pair symbol, e.g. "BTC-EUR".
+        hour : int
+            Current UTC hour; a candle opened in this hour is still forming
+            and is dropped.
+
+        Returns
+        -------
+        dict or None
+            Signal, metrics, confirmations and current price, or None if
+            there is no actionable signal.
+        """
+        try:
+            fast_df = self.data_fetcher.fetch_candles_with_indicators(
+                symbol=symbol,
+                bar=self.config.fast_bar,
+                limit=self.config.ema_limit,
+                params=self.config.strategy_params,
+            )
+            last_candle = self.data_fetcher.as_datetime(fast_df["ts"].iloc[-1])
+            last_candle_hour = last_candle.hour
+            if last_candle_hour == hour:
+                fast_df = fast_df[:-1]
+
+            confirm_df = self.data_fetcher.fetch_candles_with_indicators(
+                symbol=symbol,
+                bar=self.config.confirm_bar,
+                limit=self.config.ema_limit,
+                params=self.config.strategy_params,
+            )
+            last_confirm_candle = self.data_fetcher.as_datetime(
+                confirm_df["ts"].iloc[-1]
+            )
+            last_confirm_candle_hour = last_confirm_candle.hour
+            if last_confirm_candle_hour == hour:
+                confirm_df = confirm_df[:-1]
+
+            if (
+                fast_df is None
+                or fast_df.empty
+                or confirm_df is None
+                or confirm_df.empty
+            ):
+                logging.warning(f"No candle data for {symbol}, skipping.")
+                return None
+
+            signal_metrics = self.signal_generator.evaluate_ema_crossover_with_metrics(
+                fast_df, confirm_df
+            )
+
+            logging.info(f"Signal metrics for {symbol}: {signal_metrics}")
+            if signal_metrics is None:
+                logging.info(f"No signal generated for {symbol}, skipping.")
+                return None
+            else:
+                signal_direction = signal_metrics["signal"]
+
+            if signal_direction == "bullish":
+                final_signal = "buy"
+            elif signal_direction == "bearish":
+                final_signal = "sell"
+            else:
+                logging.info(f"No valid signal for {symbol}, skipping.")
+                return None
+
+            strategy_name = "EMA_Strategy"
+            logging.info(
+                f"Final signal for {symbol}: {final_signal}, "
+                f"strategy: {strategy_name}"
+            )
+
+            confirmation_indicators = self.signal_generator.check_confirmations(
+                confirm_df,
+                signal_direction,
+            )
+
+            current_price = self.broker.get_current_price(symbol)
+            return {
+                "final_signal": final_signal,
+                "strategy_name": strategy_name,
+                "signal_metrics": signal_metrics,
+                "confirmation_indicators": confirmation_indicators,
+                "current_price": current_price,
+            }
+        except Exception as e:
+            logging.exception(f"Error processing {symbol}: {e}")
+            return None
+
     def run(self):
         last = datetime.now(timezone.utc)
         logging.info(f"OOP Trading Bot Started at {last.isoformat()}")
@@ -48,74 +146,21 @@ class BotEngine:
                 hour % (self.config.ema_signal_check_frequency / 60) == 0
                 and minute == 1
             ):
-                for symbol in self.config.symbols:
-                    try:
-                        fast_df = self.data_fetcher.fetch_candles_with_indicators(
-                            symbol=symbol,
-                            bar=self.config.fast_bar,
-                            limit=self.config.ema_limit,
-                            params=self.config.strategy_params,
-                        )
-                        last_candle = fast_df["ts"].iloc[-1]
-                        last_candle_hour = last_candle.hour
-                        if last_candle_hour == hour:
-                            fast_df = fast_df[:-1]
-
-                        confirm_df = self.data_fetcher.fetch_candles_with_indicators(
-                            symbol=symbol,
-                            bar=self.config.confirm_bar,
-                            limit=self.config.ema_limit,
-                            params=self.config.strategy_params,
-                        )
-                        last_confirm_candle = confirm_df["ts"].iloc[-1]
-                        last_confirm_candle_hour = last_confirm_candle.hour
-                        if last_confirm_candle_hour == hour:
-                            confirm_df = confirm_df[:-1]
-
-                        if (
-                            fast_df is None
-                            or fast_df.empty
-                            or confirm_df is None
-                            or confirm_df.empty
-                        ):
-                            logging.warning(f"No candle data for {symbol}, skipping.")
-                            continue
-
-                        signal_metrics = (
-                            self.signal_generator.evaluate_ema_crossover_with_metrics(
-                                fast_df, confirm_df
-                            )
-                        )
+                symbols = self.config.symbols
+                with ThreadPoolExecutor(max_workers=max(len(symbols), 1)) as executor:
+                    evaluations = list(
+                        executor.map(lambda s: self.evaluate_symbol(s, hour), symbols)
+                    )
 
-                        logging.info(f"Signal metrics for {symbol}: {signal_metrics}")
-                        if signal_metrics is None:
-                            logging.info(f"No signal generated for {symbol}, skipping.")
-                            continue
-                        else:
-                            signal_direction = signal_metrics["signal"]
-
-                        if signal_direction == "bullish":
-                            final_signal = "buy"
-                        elif signal_direction == "bearish":
-                            final_signal = "sell"
-                        else:
-                            logging.info(f"No valid signal for {symbol}, skipping.")
-                            continue
-
-                        strategy_name = "EMA_Strategy"
-                        logging.info(
-                            f"Final signal for {symbol}: {final_signal}, "
-                            f"strategy: {strategy_name}"
-                        )
-
-                        confirmation_indicators = (
-                            self.signal_generator.check_confirmations(
-                                confirm_df,
-                                signal_direction,
-                            )
-                        )
-
-                        current_price = self.broker.get_current_price(symbol)
+                for symbol, evaluation in zip(symbols, evaluations):
+                    if evaluation is None:
+                        continue
+                    try:
+                        final_signal = evaluation["final_signal"]
+                        strategy_name = evaluation["strategy_name"]
+                        signal_metrics = evaluation["signal_metrics"]
+                        confirmation_indicators = evaluation["confirmation_indicators"]
+                        current_price = evaluation["current_price"]
 
                         params = {
                             "symbol_pair": symbol,
@@ -126,12 +171,10 @@ class BotEngine:
                             "strategy": strategy_name,
                             "processed": 0,
                         }
-                        self.db_manager_obj.connect()
                         self.db_manager_obj.log_signal(params)
                         signal_id = self.db_manager_obj.get_latest_signal_id_for_symbol(
                             symbol_pair=symbol,
                         )
-                        self.db_manager_obj.close()
 
                         signal_context = {
                             "symbol_pair": symbol,
@@ -182,8 +225,6 @@ class BotEngine:
                                 logging.info(f"Buy order for {symbol} was not placed.")
                                 continue
 
-                            self.db_manager_obj.connect()
-
                             ai_decision_id = self.db_manager_obj.get_latest_ai_decision_id_for_symbol(
                                 symbol_pair=symbol
                             )
@@ -208,11 +249,15 @@ class BotEngine:
                                 "order_status": "submitted_buy",
                             }
                             self.db_manager_obj.log_trade(trade_params)
-                            self.db_manager_obj.close()
 
                     except Exception as e:
                         logging.exception(f"Error processing {symbol}: {e}")
 
+                try:
+                    self.db_manager_obj.flush_trades()
+                except Exception as e:
+                    logging.exception(f"Failed to flush buffered trades: {e}")
+
             self.order_monitor.monitor(self.data_fetcher)
 
             now_check = datetime.now(timezone.utc)
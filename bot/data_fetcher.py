@@ -20,7 +20,7 @@ class DataFetcher:
         self.marketAPI = broker.marketAPI
         logging.info("DataFetcher initialized with OKX MarketAPI.")
 
-    def fetch_candles(self, symbol, bar, limit):
+    def fetch_candles(self, symbol, bar, limit, parse_ts: bool = False):
         try:
             candles = self.marketAPI.get_candlesticks(
                 instId=symbol, bar=bar, limit=limit
@@ -40,15 +40,19 @@ class DataFetcher:
                 ],
             )
             df = DataFetcher.convert_to_float(df)
-            df["ts"] = pd.to_datetime(df["ts"].astype(float), unit="ms")
+            df["ts"] = df["ts"].astype("int64")
+            if parse_ts:
+                df["ts"] = DataFetcher.as_datetime(df["ts"])
             df = df.sort_values("ts")
-            logging.info(f"Fetched {len(df)} candles for {symbol}")
+            logging.info("Fetched %d candles for %s", len(df), symbol)
             return df
         except Exception as e:
-            logging.error(f"Failed to fetch candles for {symbol}: {e}")
+            logging.error("Failed to fetch candles for %s: %s", symbol, e)
             return None
 
-    def fetch_candles_with_indicators(self, symbol, bar, limit, params):
+    def fetch_candles_with_indicators(
+        self, symbol, bar, limit, params, parse_ts: bool = False
+    ):
         try:
             candles = self.marketAPI.get_candlesticks(
                 instId=symbol, bar=bar, limit=limit
@@ -68,13 +72,15 @@ class DataFetcher:
                 ],
             )
             df = DataFetcher.convert_to_float(df)
-            df["ts"] = pd.to_datetime(df["ts"].astype(float), unit="ms")
+            df["ts"] = df["ts"].astype("int64")
+            if parse_ts:
+                df["ts"] = DataFetcher.as_datetime(df["ts"])
             df = df.sort_values("ts")
             df = self.add_indicator_columns(df, params)
-            logging.info(f"Fetched {len(df)} candles for {symbol}")
+            logging.info("Fetched %d candles for %s", len(df), symbol)
             return df
         except Exception as e:
-            logging.error(f"Failed to fetch candles for {symbol}: {e}")
+            logging.error("Failed to fetch candles for %s: %s", symbol, e)
             return None
 
     @staticmethod
@@ -83,16 +89,36 @@ class DataFetcher:
             numeric_cols = [col for col in df.columns if col not in skip_cols]
             df[numeric_cols] = df[numeric_cols].astype(float)
         except Exception as e:
-            logging.exception(f"Error converting to floats: {e}")
+            logging.exception("Error converting to floats: %s", e)
         return df
 
+    @staticmethod
+    def as_datetime(ts):
+        """
+        Convert OKX millisecond epoch timestamps to pandas datetimes.
+
+        Candle frames keep `ts` as int64 milliseconds; call this only where
+        datetimes are actually needed (display, logging, hour checks).
+
+        Parameters
+        ----------
+        ts : int or pandas.Series
+            Timestamp(s) in milliseconds since epoch.
+
+        Returns
+        -------
+        pandas.Timestamp or pandas.Series
+            Converted timestamp(s).
+        """
+        return pd.to_datetime(ts, unit="ms")
+
     def get_ticker(self, symbol):
         try:
             ticker = self.marketAPI.get_ticker(instId=symbol)
-            logging.info(f"Ticker fetched for {symbol}")
+            logging.info("Ticker fetched for %s", symbol)
             return ticker
         except Exception as e:
-            logging.error(f"Failed to fetch ticker for {symbol}: {e}")
+            logging.error("Failed to fetch ticker for %s: %s", symbol, e)
             return None
 
     @staticmethod
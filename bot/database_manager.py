@@ -3,11 +3,14 @@ Database manager module for handling database operations.
 
 This module defines the DatabaseManager class, which provides methods to
 connect to a SQLite database, execute queries, and manage trading signals
-and trades.
+and trades. A single long-lived connection is kept open in autocommit mode;
+callers group writes with `transaction()`.
 """
 
 import logging
 import sqlite3 as sql
+import threading
+from contextlib import contextmanager
 
 import sys
 import os
@@ -16,37 +19,162 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from common_utils.utils import current_date_utc
 
 
+SIGNAL_INSERT_QUERY = """
+INSERT INTO signals (symbol_pair, signal_type, price, ema_metrices,
+confirmation_metrices, strategy, detected_at, processed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+TRADE_INSERT_QUERY = """
+INSERT INTO trades (entry_order_id, signal_id, ai_decision_id, user_config_id,
+symbol_pair, side, quantity, entry_price, initial_stop_loss, order_status,
+opened_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+ENTRY_FILL_UPDATE_QUERY = """
+UPDATE trades
+SET order_status = ?, entry_fill_price = ?, entry_fill_quantity = ?
+WHERE entry_order_id = ?
+"""
+
+EXIT_ALGO_UPDATE_QUERY = """
+UPDATE trades
+SET order_status = ?, exit_algo_id = ?, amended_stop_loss = ?
+WHERE entry_order_id = ?
+"""
+
+STOP_LOSS_UPDATE_QUERY = """
+UPDATE trades
+SET amended_stop_loss = ?
+WHERE exit_algo_id = ?
+"""
+
+POSITION_CLOSED_UPDATE_QUERY = """
+UPDATE trades
+SET order_status = ?, exit_fill_price = ?, exit_fill_quantity = ?,
+exit_order_id = ?, closed_at = ?
+WHERE exit_algo_id = ?
+"""
+
+
 class DatabaseManager:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, flush_threshold: int = 100):
         self.db_path = db_path
         self.connection = None
+        self.flush_threshold = flush_threshold
+        self._signal_buf: list[tuple] = []
+        self._trade_buf: list[tuple] = []
+        self._tx_depth = 0
+        self._lock = threading.RLock()
+        self.connect()
 
     def connect(self):
+        """Open the shared connection; a no-op if it is already open."""
+        if self.connection is not None:
+            return
         try:
-            self.connection = sql.connect(self.db_path)
+            self.connection = sql.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            self.connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                PRAGMA foreign_keys=ON;
+                """
+            )
         except sql.Error as e:
             logging.error(f"Error connecting to database: {e}")
             raise
 
     def close(self):
-        if self.connection:
-            self.connection.close()
+        """Flush buffered signal and trade rows, then close the connection."""
+        with self._lock:
+            try:
+                if self.connection is not None:
+                    self.flush_signals()
+                    self.flush_trades()
+            finally:
+                if self.connection:
+                    self.connection.close()
+                    self.connection = None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group the enclosed statements into one transaction.
+
+        Nested uses join the outermost transaction, which commits on normal
+        exit and rolls back if an exception escapes it. The connection lock is
+        held throughout, so other threads wait rather than interleave.
+        """
+        with self._lock:
+            self.connect()
+            if self._tx_depth == 0:
+                self.connection.execute("BEGIN")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.connection.execute("COMMIT")
 
     def execute_query(self, query: str, params: tuple = ()):
+        with self._lock:
+            self.connect()
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            except sql.Error as e:
+                logging.error(f"Error executing query: {e}")
+                raise
+
+    def execute_many(self, query: str, rows: list[tuple]):
+        """Execute one statement for many parameter rows in a single transaction."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            return cursor.fetchall()
+            with self.transaction():
+                self.connection.executemany(query, rows)
         except sql.Error as e:
-            logging.error(f"Error executing query: {e}")
+            logging.error(f"Error executing batch query: {e}")
             raise
 
+    def _write_buffered(self, query: str, rows: list[tuple], describe) -> None:
+        """
+        Insert buffered rows, isolating rows that cannot be written.
+
+        The batch is tried in one transaction first. If that fails, each row is
+        retried on its own; rows that still fail are logged via `describe(row)`
+        and dropped, so one bad row cannot block every later flush.
+        """
+        try:
+            self.execute_many(query, rows)
+            return
+        except sql.Error as e:
+            logging.warning(
+                f"Batch insert of {len(rows)} buffered rows failed ({e}); "
+                f"retrying row by row."
+            )
+        for row in rows:
+            try:
+                self.execute_query(query, row)
+            except sql.Error as e:
+                logging.error(f"Dropping {describe(row)}: {e}")
+
     def log_signal(self, signal_data: dict):
-        query = """
-        INSERT INTO signals (symbol_pair, signal_type, price, ema_metrices,
-        confirmation_metrices, strategy, detected_at, processed)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        Buffer a signal row; rows are written by flush_signals().
+
+        The buffer is flushed automatically once it reaches flush_threshold.
         """
         detected_at = current_date_utc()
         params = (
@@ -59,7 +187,22 @@ class DatabaseManager:
             detected_at,
             signal_data.get("processed"),
         )
-        self.execute_query(query, params)
+        with self._lock:
+            self._signal_buf.append(params)
+            if len(self._signal_buf) >= self.flush_threshold:
+                self.flush_signals()
+
+    def flush_signals(self):
+        """Write buffered signals; rows that fail to insert are logged and dropped."""
+        with self._lock:
+            if not self._signal_buf:
+                return
+            rows, self._signal_buf = self._signal_buf, []
+            self._write_buffered(
+                SIGNAL_INSERT_QUERY,
+                rows,
+                lambda row: f"{row[1]} signal for {row[0]} detected at {row[6]}",
+            )
 
     def update_signal_processed_status_by_id(self, signal_id: int):
         query = "UPDATE signals SET processed = 1 WHERE id = ?"
@@ -75,11 +218,10 @@ class DatabaseManager:
         return result[0] if result else None
 
     def log_trade(self, trade_data: dict):
-        query = """
-        INSERT INTO trades (entry_order_id, signal_id, ai_decision_id, user_config_id,
-        symbol_pair, side, quantity, entry_price, initial_stop_loss, order_status,
-        opened_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        Buffer a trade row; rows are written by flush_trades().
+
+        The buffer is flushed automatically once it reaches flush_threshold.
         """
         opened_at = current_date_utc()
         params = (
@@ -95,7 +237,30 @@ class DatabaseManager:
             trade_data.get("order_status"),
             opened_at,
         )
-        self.execute_query(query, params)
+        with self._lock:
+            self._trade_buf.append(params)
+            if len(self._trade_buf) >= self.flush_threshold:
+                self.flush_trades()
+
+    def flush_trades(self):
+        """
+        Write buffered trades; rows that cannot be inserted are logged and dropped.
+
+        The orders behind these rows already exist on the exchange, so each
+        dropped row is logged with its entry_order_id for reconciliation.
+        """
+        with self._lock:
+            if not self._trade_buf:
+                return
+            rows, self._trade_buf = self._trade_buf, []
+            self._write_buffered(
+                TRADE_INSERT_QUERY,
+                rows,
+                lambda row: (
+                    f"trade for entry_order_id {row[0]} ({row[4]}); the order "
+                    f"exists on the exchange but has no trades record"
+                ),
+            )
 
     def update_trade_with_entry_fill(
         self,
@@ -104,13 +269,21 @@ class DatabaseManager:
         entry_fill_price: float,
         entry_fill_quantity: float,
     ):
-        query = """
-        UPDATE trades
-        SET order_status = ?, entry_fill_price = ?, entry_fill_quantity = ?
-        WHERE entry_order_id = ?
-        """
         params = (order_status, entry_fill_price, entry_fill_quantity, trade_id)
-        self.execute_query(query, params)
+        self.execute_query(ENTRY_FILL_UPDATE_QUERY, params)
+
+    def update_trade_with_entry_fill_many(self, rows: list[tuple]):
+        """
+        Batch variant of update_trade_with_entry_fill.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            (order_status, entry_fill_price, entry_fill_quantity, trade_id)
+            per trade.
+        """
+        if rows:
+            self.execute_many(ENTRY_FILL_UPDATE_QUERY, rows)
 
     def update_trade_status_with_exit_algo_order(
         self,
@@ -119,13 +292,20 @@ class DatabaseManager:
         exit_algo_id: str = None,
         stop_loss: float = None,
     ):
-        query = """
-        UPDATE trades
-        SET order_status = ?, exit_algo_id = ?, amended_stop_loss = ?
-        WHERE entry_order_id = ?
-        """
         params = (order_status, exit_algo_id, stop_loss, trade_id)
-        self.execute_query(query, params)
+        self.execute_query(EXIT_ALGO_UPDATE_QUERY, params)
+
+    def update_trade_status_with_exit_algo_order_many(self, rows: list[tuple]):
+        """
+        Batch variant of update_trade_status_with_exit_algo_order.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            (order_status, exit_algo_id, stop_loss, trade_id) per trade.
+        """
+        if rows:
+            self.execute_many(EXIT_ALGO_UPDATE_QUERY, rows)
 
     def update_trade_status_position_closed(
         self,
@@ -135,12 +315,6 @@ class DatabaseManager:
         exit_fill_quantity: float,
         exit_order_id: str = None,
     ):
-        query = """
-        UPDATE trades
-        SET order_status = ?, exit_fill_price = ?, exit_fill_quantity = ?,
-        exit_order_id = ?, closed_at = ?
-        WHERE exit_algo_id = ?
-        """
         closed_at = current_date_utc()
         params = (
             order_status,
@@ -150,16 +324,47 @@ class DatabaseManager:
             closed_at,
             trade_id,
         )
-        self.execute_query(query, params)
+        self.execute_query(POSITION_CLOSED_UPDATE_QUERY, params)
 
-    def update_stop_loss(self, trade_id: int, new_stop_loss: float):
-        query = """
-        UPDATE trades
-        SET amended_stop_loss = ?
-        WHERE exit_algo_id = ?
+    def update_trade_status_position_closed_many(self, rows: list[tuple]):
         """
+        Batch variant of update_trade_status_position_closed.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            (trade_id, order_status, exit_fill_price, exit_fill_quantity,
+            exit_order_id) per trade. closed_at is stamped once for the batch.
+        """
+        if not rows:
+            return
+        closed_at = current_date_utc()
+        self.execute_many(
+            POSITION_CLOSED_UPDATE_QUERY,
+            [
+                (order_status, price, quantity, exit_order_id, closed_at, trade_id)
+                for trade_id, order_status, price, quantity, exit_order_id in rows
+            ],
+        )
+
+    def update_stop_loss(self, trade_id: int, new_stop_loss: float):
         params = (new_stop_loss, trade_id)
-        self.execute_query(query, params)
+        self.execute_query(STOP_LOSS_UPDATE_QUERY, params)
+
+    def update_stop_loss_many(self, rows: list[tuple]):
+        """
+        Batch variant of update_stop_loss.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            (trade_id, new_stop_loss) per trade.
+        """
+        if rows:
+            self.execute_many(
+                STOP_LOSS_UPDATE_QUERY,
+                [(new_stop_loss, trade_id) for trade_id, new_stop_loss in rows],
+            )
 
     def get_trade_params_by_id(self, trade_id: int):
         query = "SELECT * FROM trades WHERE entry_order_id = ?"
@@ -198,6 +403,10 @@ class DatabaseManager:
         return result[0][0] if result else None
 
     def get_latest_signal_id_for_symbol(self, symbol_pair: str):
+        try:
+            self.flush_signals()
+        except Exception as e:
+            logging.exception(f"Failed to flush buffered signals: {e}")
         query = """
         SELECT id FROM signals
         WHERE symbol_pair = ?
@@ -218,6 +427,10 @@ class DatabaseManager:
         return result[0][0] if result else None
 
     def get_entry_orders_ids_by_status(self, order_status: str):
+        try:
+            self.flush_trades()
+        except Exception as e:
+            logging.exception(f"Failed to flush buffered trades: {e}")
         query = """
         SELECT entry_order_id, symbol_pair FROM trades
         WHERE order_status = ?
@@ -10,10 +10,52 @@ import okx.MarketData as MarketData
 import okx.Trade as Trade
 import okx.Account as Account
 import logging
+import operator
+import threading
+import numpy as np
+import orjson
 import requests
+from cachetools import TTLCache, cached, cachedmethod
+from concurrent.futures import ThreadPoolExecutor
+
+_MIN_TRADE_SIZE_CACHE = TTLCache(maxsize=2048, ttl=3600)
+_MIN_TRADE_SIZE_LOCK = threading.Lock()
+
+
+class _InstrumentNotFound(Exception):
+    """Raised so that failed instrument lookups are not cached."""
+
+
+@cached(_MIN_TRADE_SIZE_CACHE, lock=_MIN_TRADE_SIZE_LOCK)
+def _fetch_min_trade_size(symbol):
+    url = (
+        f"https://www.okx.com/api/v5/public/instruments?"
+        f"instType=SPOT&instId={symbol}"
+    )
+    response = requests.get(url)
+    data = orjson.loads(response.content)
+    if data["code"] == "0" and data["data"]:
+        instrument = data["data"][0]
+        return float(instrument["minSz"])
+    raise _InstrumentNotFound(f"Failed to fetch instrument details for {symbol}")
 
 
 class OkxBroker:
+    # (minimum last/entry price ratio, trigger multiplier), highest tier first.
+    STOP_LOSS_TIERS = (
+        (1.05, 0.999),
+        (1.04, 0.994),
+        (1.03, 0.992),
+        (1.02, 0.99),
+        (1.015, 0.98),
+        (1.01, 0.97),
+        (1.005, 0.96),
+    )
+    STOP_LOSS_FLOOR_MULTIPLIER = 0.95
+    SL_ATR_BAR = "1m"
+    SL_ATR_BAR_MS = 60_000
+    SL_BATCH_MAX_WORKERS = 8
+
     def __init__(self, config, db_manager_obj):
         self.marketAPI = MarketData.MarketAPI(flag=config.flag)
         self.accountAPI = Account.AccountAPI(
@@ -33,15 +75,27 @@ class OkxBroker:
             domain="https://my.okx.com/",
         )
         self.db_manager = db_manager_obj
+        self.atr_window = config.strategy_params["atr_window"]
+        self.atr_multiplier = config.strategy_params["atr_multiplier"]
+        # algo_id -> (atr, last confirmed bar ts, last confirmed close)
+        self._sl_atr_state = {}
+        self._price_cache = TTLCache(maxsize=256, ttl=1.0)
+        self._price_cache_lock = threading.Lock()
         logging.info("OkxBroker initialized.")
 
+    @cachedmethod(
+        operator.attrgetter("_price_cache"),
+        lock=operator.attrgetter("_price_cache_lock"),
+    )
+    def _fetch_current_price(self, symbol):
+        ticker = self.marketAPI.get_ticker(instId=symbol)
+        return float(ticker["data"][0]["last"])
+
     def get_current_price(self, symbol):
         try:
-            ticker = self.marketAPI.get_ticker(instId=symbol)
-            current_price = float(ticker["data"][0]["last"])
-            return current_price
+            return self._fetch_current_price(symbol)
         except Exception as e:
-            logging.exception(f"Failed to fetch current price for {symbol}: {e}")
+            logging.exception("Failed to fetch current price for %s: %s", symbol, e)
             return None
 
     def get_balance(self, symbol, currency_type):
@@ -60,7 +114,39 @@ class OkxBroker:
                     else:
                         return 0
         except Exception as e:
-            logging.exception(f"Failed to fetch balance: {e}")
+            logging.exception("Failed to fetch balance: %s", e)
+            return None
+
+    def get_balances(self, symbols, currency_type):
+        """
+        Fetch available balances for several symbols with one request.
+
+        Parameters
+        ----------
+        symbols : list of str
+            Trading pair symbols, e.g. ["BTC-EUR", "ETH-EUR"].
+        currency_type : {"base", "quote"}
+            Which side of each pair to look up.
+
+        Returns
+        -------
+        dict or None
+            Available balance per symbol (0 when the currency is not held),
+            or None if the request failed.
+        """
+        try:
+            side = 0 if currency_type == "base" else 1
+            balances = self.accountAPI.get_account_balance()
+            available = {
+                asset["ccy"]: float(asset["availBal"])
+                for asset in balances["data"][0]["details"]
+            }
+            return {
+                symbol: max(available.get(symbol.split("-")[side], 0.0), 0.0)
+                for symbol in symbols
+            }
+        except Exception as e:
+            logging.exception("Failed to fetch balances: %s", e)
             return None
 
     def get_total_capital_usd(self):
@@ -77,7 +163,7 @@ class OkxBroker:
                     total_assets_usd += asset_usd
             return total_assets_usd
         except Exception as e:
-            logging.exception(f"Failed to fetch balance in USD: {e}")
+            logging.exception("Failed to fetch balance in USD: %s", e)
 
     def get_available_euro_balance(self):
         try:
@@ -98,7 +184,7 @@ class OkxBroker:
 
     def place_buy_market_order(self, symbol, size):
         try:
-            logging.info(f"Placing market buy order for {symbol} of size {size}")
+            logging.info("Placing market buy order for %s of size %s", symbol, size)
             order = self.tradeAPI.place_order(
                 instId=symbol,
                 tdMode="cash",
@@ -109,7 +195,7 @@ class OkxBroker:
             return order
 
         except Exception as e:
-            logging.exception(f"Market order error: {e}")
+            logging.exception("Market order error: %s", e)
 
     def get_order_details(self, order_id, symbol):
         try:
@@ -119,13 +205,30 @@ class OkxBroker:
             print(f"Failed to fetch order details: {e}")
             return None
 
-    def get_filled_orders(self, active_orders):
+    def get_filled_orders(self, active_orders, order_states=None):
+        """
+        Split active buy orders by their exchange state.
+
+        Parameters
+        ----------
+        active_orders : list of tuple
+            (order_id, symbol_pair) pairs.
+        order_states : dict, optional
+            Order data pushed by the private WebSocket, keyed by order ID.
+            Orders found here are classified without a REST request.
+        """
+        order_states = order_states or {}
         filled_orders = []
         other_orders = []
         canceled_orders = []
         try:
             for order_id, symbol_pair in active_orders:
-                result = self.tradeAPI.get_order(instId=symbol_pair, ordId=order_id)
+                if order_id in order_states:
+                    result = {"code": "0", "data": [order_states[order_id]]}
+                else:
+                    result = self.tradeAPI.get_order(
+                        instId=symbol_pair, ordId=order_id
+                    )
                 if result["code"] == "0":
                     status = result["data"][0].get("state")
                     fail_code = result["data"][0].get("failCode")
@@ -137,11 +240,11 @@ class OkxBroker:
                         other_orders.append(order_id)
                 else:
                     logging.warning(
-                        f"Failed to get info on successful order: {order_id}"
+                        "Failed to get info on successful order: %s", order_id
                     )
             return filled_orders, other_orders, canceled_orders
         except Exception as e:
-            logging.exception(f"Order status retrieving error: {e}")
+            logging.exception("Order status retrieving error: %s", e)
             return None, None, None
 
     def place_stop_loss_sell_order(self, symbol, entry_size, initial_stop_loss_price):
@@ -154,9 +257,40 @@ class OkxBroker:
             )
             return algo_id
         except Exception as e:
-            logging.exception(f"Failed to place stop loss for {symbol}: {e}")
+            logging.exception("Failed to place stop loss for %s: %s", symbol, e)
             return None
 
+    def place_stop_loss_sell_orders_batch(self, orders):
+        """
+        Place several stop loss sell orders concurrently.
+
+        OKX has no batch endpoint for algo orders, so the requests are
+        issued in parallel instead of one after another.
+
+        Parameters
+        ----------
+        orders : list of dict
+            Each with "symbol", "size" and "sl_price" keys.
+
+        Returns
+        -------
+        list
+            Algo order IDs in the same order as `orders`; None where
+            placement failed.
+        """
+        if not orders:
+            return []
+        workers = min(len(orders), self.SL_BATCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda order: self.place_stop_loss_sell_order(
+                        order["symbol"], order["size"], order["sl_price"]
+                    ),
+                    orders,
+                )
+            )
+
     def place_conditional_sl_market_order(self, symbol, size, trigger_price, side):
         order_type = "conditional"
         min_order = self.get_min_trade_size(symbol)
@@ -174,29 +308,48 @@ class OkxBroker:
                 )
                 if order["code"] == "0":
                     algo_id = order["data"][0]["algoId"]
-                    logging.info(f"✅ Algo order placed: {order}")
+                    if logging.getLogger().isEnabledFor(logging.INFO):
+                        logging.info("✅ Algo order placed: %s", order)
                     return algo_id
                 elif order["code"] == "1":
                     logging.warning(
-                        f"Not enough funds. Reducing size and retrying. "
-                        f"Current size: {size}"
+                        "Not enough funds. Reducing size and retrying. "
+                        "Current size: %s",
+                        size,
                     )
                     size *= 0.995
                     continue
                 else:
-                    logging.error(f"Algo order for {symbol} failed: {order}")
+                    if logging.getLogger().isEnabledFor(logging.ERROR):
+                        logging.error("Algo order for %s failed: %s", symbol, order)
                     return None
             except Exception as e:
-                logging.exception(f"Algo order error: {e}")
+                logging.exception("Algo order error: %s", e)
                 return None
 
-    def get_successful_algo_orders(self, algo_ids):
+    def get_successful_algo_orders(self, algo_ids, algo_states=None):
+        """
+        Split active stop loss algo orders by their exchange state.
+
+        Parameters
+        ----------
+        algo_ids : list of tuple
+            (algo_id, symbol_pair) pairs.
+        algo_states : dict, optional
+            Algo order data pushed by the private WebSocket, keyed by algo ID.
+            Algos streamed as "live" skip the REST request; any other state
+            is confirmed over REST to get its failure code.
+        """
+        algo_states = algo_states or {}
         effective_algos = []
         live_algos = []
         other_algos = []
         effective_failed_tp_algos = []
         try:
             for algo_id, symbol_pair in algo_ids:
+                if algo_states.get(algo_id, {}).get("state") == "live":
+                    live_algos.append((algo_id, symbol_pair))
+                    continue
                 result = self.tradeAPI.get_algo_order_details(algoId=algo_id)
                 if result["code"] == "0":
                     status = result["data"][0].get("state")
@@ -208,7 +361,9 @@ class OkxBroker:
                             effective_failed_tp_algos.append((algo_id, symbol_pair))
                             if fail_code != "51008":
                                 logging.warning(
-                                    f"Fail code of effective order {fail_code} {algo_id}"
+                                    "Fail code of effective order %s %s",
+                                    fail_code,
+                                    algo_id,
                                 )
                         else:
                             effective_algos.append((algo_id, symbol_pair))
@@ -216,11 +371,13 @@ class OkxBroker:
                         other_algos.append((algo_id, symbol_pair))
                 else:
                     logging.warning(
-                        f"Failed to get info on successful order: {algo_id}"
+                        "Failed to get info on successful order: %s", algo_id
                     )
+            for algo_id, _ in effective_algos + other_algos + effective_failed_tp_algos:
+                self._sl_atr_state.pop(algo_id, None)
             return live_algos, effective_algos, other_algos, effective_failed_tp_algos
         except Exception as e:
-            logging.exception(f"Order status retrieving error: {e}")
+            logging.exception("Order status retrieving error: %s", e)
             return None, None, None
 
     def process_sl_order(self, data_fetcher, sl_algo_id, symbol):
@@ -228,7 +385,7 @@ class OkxBroker:
             result = self.tradeAPI.get_algo_order_details(algoId=sl_algo_id)
             if result["code"] != "0":
                 logging.warning(
-                    f"Getting algo order details failed for algoId: {sl_algo_id}"
+                    "Getting algo order details failed for algoId: %s", sl_algo_id
                 )
                 return None
             else:
@@ -238,30 +395,32 @@ class OkxBroker:
 
                 if current_price is None or sl_trigger_price is None:
                     logging.warning(
-                        f"Missing 'last' or 'slTriggerPx' in response: {data[0]}"
+                        "Missing 'last' or 'slTriggerPx' in response: %s", data[0]
                     )
                     return None
                 else:
                     try:
-                        df = data_fetcher.fetch_candles(
-                            symbol=symbol, bar="1m", limit=5
+                        atr, last_price = self.update_sl_atr(
+                            data_fetcher, sl_algo_id, symbol
                         )
-                        last_price = float(df["high"].max())
                     except Exception as e:
                         logging.exception(
-                            f"Failed to fetch candles for {symbol} in process_sl_order: "
-                            f"{e}"
+                            "Failed to fetch candles for %s in process_sl_order: %s",
+                            symbol,
+                            e,
                         )
-                        last_price = float(current_price)
+                        atr, last_price = None, float(current_price)
 
-                    self.db_manager.connect()
                     buy_order_fill_price = self.db_manager.get_entry_price_by_algo_id(
                         sl_algo_id
                     )
-                    self.db_manager.close()
                     new_trigger_price = self.custom_stop_loss_logic(
                         last_price, buy_order_fill_price
                     )
+                    if atr is not None:
+                        new_trigger_price = min(
+                            new_trigger_price, last_price - self.atr_multiplier * atr
+                        )
 
                     if new_trigger_price > sl_trigger_price:
                         success = self.amend_conditional_order(
@@ -273,9 +432,68 @@ class OkxBroker:
                             return new_trigger_price
         except Exception as e:
             logging.exception(
-                f"Error occurred while checking sl trigger price for {sl_algo_id}, {e}"
+                "Error occurred while checking sl trigger price for %s, %s",
+                sl_algo_id,
+                e,
             )
 
+    def update_sl_atr(self, data_fetcher, sl_algo_id, symbol):
+        """
+        Advance the Wilder-smoothed ATR kept for a live stop loss order.
+
+        The first call (or a call after missed bars) seeds the ATR from the
+        last `atr_window + 1` confirmed bars; afterwards only the newest bars
+        are fetched and each new confirmed bar costs a single update
+        ``atr += (tr - atr) / atr_window``.
+
+        Parameters
+        ----------
+        data_fetcher : DataFetcher
+            Used to fetch candles.
+        sl_algo_id : str
+            Stop loss algo order ID the state belongs to.
+        symbol : str
+            Trading pair symbol, e.g. "BTC-EUR".
+
+        Returns
+        -------
+        tuple of (float, float)
+            Current ATR and close of the latest confirmed bar.
+        """
+        state = self._sl_atr_state.get(sl_algo_id)
+        if state is not None:
+            df = data_fetcher.fetch_candles(symbol=symbol, bar=self.SL_ATR_BAR, limit=2)
+            bar = df[df["confirm"] == 1].iloc[-1]
+            atr, last_ts, prev_close = state
+            ts = int(bar["ts"])
+            if ts == last_ts:
+                return atr, prev_close
+            if ts == last_ts + self.SL_ATR_BAR_MS:
+                high = float(bar["high"])
+                low = float(bar["low"])
+                close = float(bar["close"])
+                tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+                atr += (tr - atr) / self.atr_window
+                self._sl_atr_state[sl_algo_id] = (atr, ts, close)
+                return atr, close
+
+        df = data_fetcher.fetch_candles(
+            symbol=symbol, bar=self.SL_ATR_BAR, limit=self.atr_window + 2
+        )
+        df = df[df["confirm"] == 1].tail(self.atr_window + 1)
+        high = df["high"].to_numpy()
+        low = df["low"].to_numpy()
+        close = df["close"].to_numpy()
+        prev_close = close[:-1]
+        tr = np.maximum(
+            high[1:] - low[1:],
+            np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)),
+        )
+        atr = float(tr.mean())
+        last_close = float(close[-1])
+        self._sl_atr_state[sl_algo_id] = (atr, int(df["ts"].iloc[-1]), last_close)
+        return atr, last_close
+
     def amend_conditional_order(
         self,
         symbol,
@@ -291,17 +509,20 @@ class OkxBroker:
             if amend_result["code"] == "0":
                 status = "amended"
                 logging.info(
-                    f"✅ SL order amended: {algo_id} with price {new_trigger_price:.1f}"
+                    "✅ SL order amended: %s with price %.1f",
+                    algo_id,
+                    new_trigger_price,
                 )
                 return True
             else:
                 status = amend_result["msg"]
-                logging.warning(
-                    f"Amend order failed: {status}. Response: {amend_result}"
-                )
+                if logging.getLogger().isEnabledFor(logging.WARNING):
+                    logging.warning(
+                        "Amend order failed: %s. Response: %s", status, amend_result
+                    )
                 return False
         except Exception as e:
-            logging.exception(f"Amend order error: {e}")
+            logging.exception("Amend order error: %s", e)
             return False
 
     def get_algo_order_execution_details(self, algo_id, symbol):
@@ -327,8 +548,10 @@ class OkxBroker:
                     price = float(order_details["avgPx"])
                 else:
                     logging.warning(
-                        f"Effective algo {algo_id} did not get size and price. "
-                        f"Failure code: {result['code']}"
+                        "Effective algo %s did not get size and price. "
+                        "Failure code: %s",
+                        algo_id,
+                        result["code"],
                     )
                     size = None
                     price = None
@@ -336,11 +559,11 @@ class OkxBroker:
                 return order_id, size, price
             else:
                 logging.warning(
-                    f"Get execution details code not 0. Might be time out issue. "
-                    f"{algo_id}."
+                    "Get execution details code not 0. Might be time out issue. %s.",
+                    algo_id,
                 )
         except Exception as e:
-            logging.exception(f"Retrieving execution details error: {e}")
+            logging.exception("Retrieving execution details error: %s", e)
             return None, None, None, None
 
     def cancel_algo_order(self, algo_id, symbol, msg=""):
@@ -350,54 +573,63 @@ class OkxBroker:
             ]
             order = self.tradeAPI.cancel_algo_order(algo_orders)
             if order["code"] == "0":
-                logging.info(f"✅ Algo order cancelled: {order}")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info("✅ Algo order cancelled: %s", order)
                 return True
             else:
-                logging.warning(
-                    f"Failed to cancel algo order: {order} | {msg} "
-                    f"Consider checking if new stop loss needed."
-                )
+                if logging.getLogger().isEnabledFor(logging.WARNING):
+                    logging.warning(
+                        "Failed to cancel algo order: %s | %s "
+                        "Consider checking if new stop loss needed.",
+                        order,
+                        msg,
+                    )
                 return False
         except Exception as e:
-            logging.exception(f"Algo order cancellation error: {e}")
+            logging.exception("Algo order cancellation error: %s", e)
             return False
 
     @staticmethod
     def custom_stop_loss_logic(last_price, buy_order_fill_price):
-        if last_price >= buy_order_fill_price * 1.05:
-            new_trigger_price = last_price * 0.999
-        elif last_price >= buy_order_fill_price * 1.04:
-            new_trigger_price = last_price * 0.994
-        elif last_price >= buy_order_fill_price * 1.03:
-            new_trigger_price = last_price * 0.992
-        elif last_price >= buy_order_fill_price * 1.02:
-            new_trigger_price = last_price * 0.99
-        elif last_price >= buy_order_fill_price * 1.015:
-            new_trigger_price = last_price * 0.98
-        elif last_price >= buy_order_fill_price * 1.01:
-            new_trigger_price = last_price * 0.97
-        elif last_price >= buy_order_fill_price * 1.005:
-            new_trigger_price = last_price * 0.96
-        else:
-            new_trigger_price = last_price * 0.95
-
-        return new_trigger_price
+        for min_ratio, multiplier in OkxBroker.STOP_LOSS_TIERS:
+            if last_price >= buy_order_fill_price * min_ratio:
+                return last_price * multiplier
+        return last_price * OkxBroker.STOP_LOSS_FLOOR_MULTIPLIER
 
     @staticmethod
-    def get_min_trade_size(symbol):
-        url = (
-            f"https://www.okx.com/api/v5/public/instruments?"
-            f"instType=SPOT&instId={symbol}"
+    def custom_stop_loss_logic_vec(last_prices, buy_order_fill_prices):
+        """
+        Vectorized variant of `custom_stop_loss_logic` for backtests.
+
+        Parameters
+        ----------
+        last_prices : array-like
+            Last traded prices.
+        buy_order_fill_prices : array-like
+            Entry fill prices, same shape as `last_prices`.
+
+        Returns
+        -------
+        numpy.ndarray
+            New stop loss trigger prices, one per input pair.
+        """
+        last = np.asarray(last_prices, dtype=np.float64)
+        entry = np.asarray(buy_order_fill_prices, dtype=np.float64)
+        conditions = [
+            last >= entry * min_ratio for min_ratio, _ in OkxBroker.STOP_LOSS_TIERS
+        ]
+        multipliers = [multiplier for _, multiplier in OkxBroker.STOP_LOSS_TIERS]
+        return last * np.select(
+            conditions, multipliers, default=OkxBroker.STOP_LOSS_FLOOR_MULTIPLIER
         )
+
+    @staticmethod
+    def get_min_trade_size(symbol):
         try:
-            response = requests.get(url)
-            data = response.json()
-            if data["code"] == "0" and data["data"]:
-                instrument = data["data"][0]
-                return float(instrument["minSz"])
-            else:
-                logging.warning(f"Failed to fetch instrument details for {symbol}")
+            return _fetch_min_trade_size(symbol)
+        except _InstrumentNotFound as e:
+            logging.warning("%s", e)
         except Exception as e:
             logging.exception(
-                f"Error fetching minimum required trade size with request: {e}"
+                "Error fetching minimum required trade size with request: %s", e
             )
@@ -0,0 +1,141 @@
+"""
+OKX private WebSocket module for streaming order and algo order updates.
+
+This module defines the OkxWsPrivate class, which keeps an authenticated
+connection to the OKX private WebSocket in a background thread, subscribes
+to the `orders` and `orders-algo` channels and queues every pushed update.
+The order monitor drains the queue on each tick instead of polling the REST
+API for every open order.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+
+import orjson
+from okx.websocket.WsPrivateAsync import WsPrivateAsync
+
+EEA_PRIVATE_WS_URL = "wss://wseea.okx.com:8443/ws/v5/private"
+
+SUBSCRIPTION_ARGS = [
+    {"channel": "orders", "instType": "SPOT"},
+    {"channel": "orders-algo", "instType": "SPOT"},
+]
+
+
+class OkxWsPrivate:
+    RECONNECT_DELAY_SECONDS = 5
+    PING_INTERVAL_SECONDS = 25
+
+    def __init__(self, config, url=EEA_PRIVATE_WS_URL):
+        self.api_key = config.api_key
+        self.secret_key = config.secret_key
+        self.passphrase = config.passphrase
+        self.url = url
+        self.connected = False
+        self.generation = 0
+        self._events = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._loop = None
+        self._ws = None
+
+    def start(self):
+        """Start the background thread that owns the WebSocket connection."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(self._run(),), name="okx-ws", daemon=True
+        )
+        self._thread.start()
+        logging.info("OkxWsPrivate started.")
+
+    def stop(self):
+        self._stopped.set()
+        if self._loop is not None and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._ws.factory.close(), self._loop)
+
+    def drain(self):
+        """
+        Return the updates received since the previous call.
+
+        Returns
+        -------
+        tuple of (dict, dict, int)
+            Latest pushed order data keyed by ordId, latest pushed algo order
+            data keyed by algoId, and the connection generation. The
+            generation changes whenever the stream reconnects, which means
+            updates may have been missed in between.
+        """
+        orders = {}
+        algos = {}
+        while True:
+            try:
+                channel, data = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if channel == "orders":
+                orders[data["ordId"]] = data
+            else:
+                algos[data["algoId"]] = data
+        return orders, algos, self.generation
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        while not self._stopped.is_set():
+            self._ws = WsPrivateAsync(
+                apiKey=self.api_key,
+                passphrase=self.passphrase,
+                secretKey=self.secret_key,
+                url=self.url,
+                useServerTime=False,
+            )
+            ping_task = None
+            try:
+                await self._ws.connect()
+                if self._ws.websocket is None:
+                    raise ConnectionError(f"Could not connect to {self.url}")
+                await self._ws.subscribe(SUBSCRIPTION_ARGS, self._on_message)
+                self.generation += 1
+                self.connected = True
+                ping_task = asyncio.create_task(self._keepalive())
+                await self._ws.consume()
+            except Exception as e:
+                logging.warning("OKX private WebSocket error: %s", e)
+            finally:
+                self.connected = False
+                if ping_task is not None:
+                    ping_task.cancel()
+                await self._ws.factory.close()
+            if not self._stopped.is_set():
+                logging.info(
+                    "OKX private WebSocket disconnected, reconnecting in %ss",
+                    self.RECONNECT_DELAY_SECONDS,
+                )
+                await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.PING_INTERVAL_SECONDS)
+            await self._ws.websocket.send("ping")
+
+    def _on_message(self, message):
+        if message == "pong":
+            return
+        try:
+            payload = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            logging.warning("Unexpected OKX WebSocket message: %s", message)
+            return
+        event = payload.get("event")
+        if event == "error":
+            logging.error("OKX WebSocket error event: %s", payload)
+            return
+        if event is not None:
+            logging.info("OKX WebSocket event: %s", event)
+            return
+        channel = payload.get("arg", {}).get("channel")
+        for data in payload.get("data", []):
+            self._events.put((channel, data))
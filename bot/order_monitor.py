@@ -4,24 +4,51 @@ Order monitoring module for handling buy, take profit, and stop loss orders.
 This module defines the OrderMonitor class, which interacts with a broker's API
 to monitor the status of buy orders and take profit/stop loss orders. It includes
 methods for monitoring buy orders, take profit/stop loss orders, and updating
-the database accordingly.
+the database accordingly. When an order stream (OkxWsPrivate) is attached,
+pushed order states replace most of the REST status polling.
 """
 
+import asyncio
 import logging
-import time
 from okx_broker import OkxBroker
 
 
 class OrderMonitor:
-    def __init__(self, broker, db_manager, config):
+    def __init__(self, broker, db_manager, config, order_stream=None):
         self.tradeAPI = broker.tradeAPI
         self.accountAPI = broker.accountAPI
         self.broker = broker
         self.db_manager = db_manager
         self.symbols = config.symbols
         self.config = config
+        self.order_stream = order_stream
+        self._order_states = {}
+        self._algo_states = {}
+        self._stream_generation = None
+        for symbol in self.symbols:
+            OkxBroker.get_min_trade_size(symbol)
         logging.info("OrderMonitor initialized.")
 
+    def sync_order_stream(self):
+        """
+        Merge order updates pushed since the last tick into the local state.
+
+        Streamed states are only trusted while the stream is connected and has
+        not reconnected in between; otherwise they are discarded and the
+        monitor falls back to REST polling for every order.
+        """
+        if self.order_stream is None:
+            return
+        orders, algos, generation = self.order_stream.drain()
+        if not self.order_stream.connected or generation != self._stream_generation:
+            self._order_states.clear()
+            self._algo_states.clear()
+            self._stream_generation = generation
+            if not self.order_stream.connected:
+                return
+        self._order_states.update(orders)
+        self._algo_states.update(algos)
+
     def monitor_buy_orders(self):
         """
         Monitor buy orders and handle filled and canceled orders.
@@ -31,18 +58,23 @@ class OrderMonitor:
         If a buy order is canceled, update the trade status accordingly.
         """
         try:
-            self.db_manager.connect()
             active_orders = self.db_manager.get_entry_orders_ids_by_status(
                 order_status="submitted_buy"
             )
-            self.db_manager.close()
             if active_orders:
                 logging.info(f"Open order ids: {active_orders}")
             filled_orders, other_orders, canceled_orders = (
                 self.broker.get_filled_orders(
                     active_orders=active_orders,
+                    order_states=self._order_states,
                 )
             )
+            active_ids = {order_id for order_id, _ in active_orders}
+            self._order_states = {
+                order_id: data
+                for order_id, data in self._order_states.items()
+                if order_id in active_ids
+            }
             if filled_orders:
                 logging.info(f"Filled buy orders: {filled_orders}")
             if canceled_orders:
@@ -51,76 +83,104 @@ class OrderMonitor:
                 logging.warning(
                     f"Other buy orders (NEEDS INVESTIGATION): {other_orders}"
                 )
+            fills = []
             for filled_order_id, result in filled_orders:
-                logging.info("checking affective algo ids in order to place tp/sl")
                 symbol = result["data"][0]["instId"]
                 entry_size = float(result["data"][0]["accFillSz"])
                 base_entry_price = float(result["data"][0]["avgPx"])
-                try:
-                    self.db_manager.connect()
-                    self.db_manager.update_trade_with_entry_fill(
-                        filled_order_id, "filled_buy", base_entry_price, entry_size
-                    )
-                    self.db_manager.close()
-                except Exception as e:
-                    logging.exception(
-                        f"Failed to update trade for {filled_order_id}: {e}"
+                fills.append((filled_order_id, symbol, base_entry_price, entry_size))
+            try:
+                self.db_manager.update_trade_with_entry_fill_many(
+                    [
+                        ("filled_buy", base_entry_price, entry_size, filled_order_id)
+                        for filled_order_id, _, base_entry_price, entry_size in fills
+                    ]
+                )
+            except Exception as e:
+                logging.exception(
+                    f"Failed to update trades for {[row[0] for row in fills]}: {e}"
+                )
+                fills = []
+
+            base_balances = {}
+            if fills:
+                base_balances = self.broker.get_balances(
+                    [symbol for _, symbol, _, _ in fills], "base"
+                )
+                if base_balances is None:
+                    logging.warning(
+                        "Failed to fetch balances in monitor_buy_orders. "
+                        "Using entry sizes from filled orders."
                     )
-                    continue
+                    base_balances = {}
 
-                try:
-                    balance = float(self.broker.get_balance(symbol, "base"))
+            sl_orders = []
+            for filled_order_id, symbol, base_entry_price, entry_size in fills:
+                logging.info("checking affective algo ids in order to place tp/sl")
+                balance = base_balances.get(symbol)
+                if balance:
                     entry_size = balance
-                except Exception as e:
-                    logging.exception(
-                        f"Failed to fetch {symbol} balance in monitor_buy_orders: {e} "
-                        f" Using entry size from filled order: {entry_size}"
-                    )
+                logging.info(
+                    f"Placing stop loss order... with {base_entry_price} "
+                    f"and {self.config.buy_stop_loss_pct_multiplier}"
+                )
+                sl_orders.append(
+                    {
+                        "filled_order_id": filled_order_id,
+                        "symbol": symbol,
+                        "size": entry_size,
+                        "sl_price": (
+                            base_entry_price * self.config.buy_stop_loss_pct_multiplier
+                        ),
+                    }
+                )
 
-                try:
-                    logging.info(
-                        f"Placing stop loss order... with {base_entry_price} "
-                        f"and {self.config.buy_stop_loss_pct_multiplier}"
-                    )
-                    initial_stop_loss_price = (
-                        base_entry_price * self.config.buy_stop_loss_pct_multiplier
-                    )
-                    logging.info("all good")
-                    exit_algo_order_id = self.broker.place_stop_loss_sell_order(
-                        symbol,
-                        entry_size,
-                        initial_stop_loss_price,
-                    )
-                    if exit_algo_order_id is not None:
-                        self.db_manager.connect()
-                        self.db_manager.update_trade_status_with_exit_algo_order(
-                            filled_order_id,
+            sl_placements = []
+            try:
+                exit_algo_order_ids = self.broker.place_stop_loss_sell_orders_batch(
+                    sl_orders
+                )
+            except Exception as e:
+                logging.warning(f"Stop loss batch for {sl_orders} failed: {e}")
+                exit_algo_order_ids = []
+            for order, exit_algo_order_id in zip(sl_orders, exit_algo_order_ids):
+                if exit_algo_order_id is not None:
+                    sl_placements.append(
+                        (
                             "placed_stop_loss",
                             exit_algo_order_id,
-                            initial_stop_loss_price,
-                        )
-                        self.db_manager.close()
-                    else:
-                        logging.warning(
-                            f"Stop loss order placement failed for {filled_order_id}"
+                            order["sl_price"],
+                            order["filled_order_id"],
                         )
-                except Exception as e:
-                    logging.warning(f"Buy order {filled_order_id} failed: {e}")
-
-            for canceled_order_id in canceled_orders:
-                try:
-                    self.db_manager.connect()
-                    self.db_manager.update_trade_with_entry_fill(
-                        "-1", "canceled_buy", 0.0, 0.0
                     )
-                    self.db_manager.close()
-                except Exception as e:
-                    logging.exception(
-                        f"Failed to update canceled trade for {canceled_order_id}: {e}"
+                else:
+                    logging.warning(
+                        f"Stop loss order placement failed for "
+                        f"{order['filled_order_id']}"
                     )
-                    continue
+            try:
+                self.db_manager.update_trade_status_with_exit_algo_order_many(
+                    sl_placements
+                )
+            except Exception as e:
+                logging.exception(
+                    f"Failed to record stop losses "
+                    f"{[row[1] for row in sl_placements]}: {e}"
+                )
+
+            with self.db_manager.transaction():
+                for canceled_order_id in canceled_orders:
+                    try:
+                        self.db_manager.update_trade_with_entry_fill(
+                            "-1", "canceled_buy", 0.0, 0.0
+                        )
+                    except Exception as e:
+                        logging.exception(
+                            f"Failed to update canceled trade for "
+                            f"{canceled_order_id}: {e}"
+                        )
+                        continue
         except Exception as e:
-            self.db_manager.close()
             logging.exception(f"Error monitoring BUY orders: {e}")
 
     def monitor_tp_sl_orders(self, data_fetcher):
@@ -135,11 +195,9 @@ class OrderMonitor:
             Instance of DataFetcher to retrieve market data.
         """
         try:
-            self.db_manager.connect()
             active_algo_ids = self.db_manager.get_exit_algo_ids_by_status(
                 order_status="placed_stop_loss"
             )
-            self.db_manager.close()
             if active_algo_ids:
                 logging.info(f"Active TP/SL algo ids: {active_algo_ids}")
             (
@@ -149,7 +207,15 @@ class OrderMonitor:
                 effective_failed_tp_algos,
             ) = self.broker.get_successful_algo_orders(
                 algo_ids=active_algo_ids,
+                algo_states=self._algo_states,
             )
+            active_ids = {algo_id for algo_id, _ in active_algo_ids}
+            self._algo_states = {
+                algo_id: data
+                for algo_id, data in self._algo_states.items()
+                if algo_id in active_ids
+            }
+            stop_loss_updates = []
             for live_algo_id, symbol in live_tp_algos:
                 new_stop_loss = self.broker.process_sl_order(
                     data_fetcher,
@@ -157,41 +223,53 @@ class OrderMonitor:
                     symbol,
                 )
                 if new_stop_loss is not None:
-                    try:
-                        self.db_manager.connect()
-                        self.db_manager.update_stop_loss(live_algo_id, new_stop_loss)
-                        self.db_manager.close()
-                    except Exception as e:
-                        logging.exception(
-                            f"Failed to update stop loss price in DB for "
-                            f"{live_algo_id}: {e}"
-                        )
+                    stop_loss_updates.append((live_algo_id, new_stop_loss))
 
+            closed_positions = []
             for effective_algo_id, symbol in effective_tp_algos:
                 order_id, exit_fill_size, exit_fill_price = (
                     self.broker.get_algo_order_execution_details(
                         effective_algo_id, symbol
                     )
                 )
-                self.db_manager.connect()
-                self.db_manager.update_trade_status_position_closed(
-                    effective_algo_id,
-                    "closed",
-                    exit_fill_price,
-                    exit_fill_size,
-                    order_id,
+                closed_positions.append(
+                    (effective_algo_id, exit_fill_price, exit_fill_size, order_id)
                 )
-                self.db_manager.close()
 
-            for algo_id, symbol in other_tp_algos + effective_failed_tp_algos:
+            try:
+                self.db_manager.update_stop_loss_many(stop_loss_updates)
+            except Exception as e:
+                logging.exception(
+                    f"Failed to update stop loss prices in DB for "
+                    f"{[row[0] for row in stop_loss_updates]}: {e}"
+                )
+            try:
+                self.db_manager.update_trade_status_position_closed_many(
+                    [
+                        (effective_algo_id, "closed", price, size, order_id)
+                        for effective_algo_id, price, size, order_id in closed_positions
+                    ]
+                )
+            except Exception as e:
+                logging.exception(
+                    f"Failed to record closed positions in DB for "
+                    f"{[row[0] for row in closed_positions]}: {e}"
+                )
+
+            unresolved_algos = other_tp_algos + effective_failed_tp_algos
+            base_balances = {}
+            if unresolved_algos and self.broker is not None:
+                base_balances = (
+                    self.broker.get_balances(
+                        [symbol for _, symbol in unresolved_algos], "base"
+                    )
+                    or {}
+                )
+            for algo_id, symbol in unresolved_algos:
                 logging.warning(
                     f"TP/SL algo {algo_id} for {symbol} requires manual investigation."
                 )
-                base_balance = (
-                    self.broker.get_balance(symbol, "base")
-                    if self.broker is not None
-                    else 0
-                )
+                base_balance = base_balances.get(symbol, 0)
                 min_order = OkxBroker.get_min_trade_size(symbol)
                 if base_balance > min_order:
                     logging.info(
@@ -200,18 +278,26 @@ class OrderMonitor:
                         f"Add it as new row in the trades table."
                     )
         except Exception as e:
-            self.db_manager.close()
             logging.exception(f"Error monitoring TAKE PROFIT AND STOP LOSS orders: {e}")
 
+    async def monitor_async(self, data_fetcher):
+        """
+        Run the buy and TP/SL passes concurrently.
+
+        Both passes are blocking (REST calls through the OKX SDK), so each
+        runs in a worker thread and the two are awaited together.
+        """
+        logging.info("Monitor buy orders and tp sl orders...")
+        await asyncio.gather(
+            asyncio.to_thread(self.monitor_buy_orders),
+            asyncio.to_thread(self.monitor_tp_sl_orders, data_fetcher),
+        )
+
     def monitor(self, data_fetcher):
         logging.info("Monitoring orders...")
         try:
-            logging.info("Monitor buy orders...")
-            self.monitor_buy_orders()
-            time.sleep(5)
-            logging.info("Monitor tp sl orders...")
-            self.monitor_tp_sl_orders(data_fetcher)
-            time.sleep(5)
+            self.sync_order_stream()
+            asyncio.run(self.monitor_async(data_fetcher))
 
             logging.info("Order monitoring complete.\n")
         except Exception as e:
@@ -21,6 +21,7 @@ from logger_manager import LoggerManager
 from signal_generator import SignalGenerator
 from data_fetcher import DataFetcher
 from okx_broker import OkxBroker
+from okx_ws import OkxWsPrivate
 from bot_engine import BotEngine
 from bot.trade_executor import TradeExecutor
 from bot.order_monitor import OrderMonitor
@@ -40,7 +41,9 @@ def main():
     signal_generator = SignalGenerator(config)
 
     trade_executor = TradeExecutor(broker, db_manager, config)
-    order_monitor = OrderMonitor(broker, db_manager, config)
+    order_stream = OkxWsPrivate(config)
+    order_stream.start()
+    order_monitor = OrderMonitor(broker, db_manager, config, order_stream)
 
     bot = BotEngine(
         config,
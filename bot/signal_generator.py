@@ -7,11 +7,66 @@ long-term trends, and confirmation indicators to generate trading signals.
 
 import pandas as pd
 import numpy as np
-from scipy.stats import linregress
+from functools import lru_cache
 from typing import Literal
 import logging
 
 
+@lru_cache(maxsize=None)
+def _x_centered(window: int) -> np.ndarray:
+    """Return arange(window) minus its mean, read-only so it can be shared."""
+    x = np.arange(window, dtype=np.float64) - (window - 1) / 2
+    x.flags.writeable = False
+    return x
+
+
+def _slope(y: np.ndarray) -> float:
+    """Least-squares slope of `y` against its positions 0..len(y)-1."""
+    if len(y) == 2:
+        return y[1] - y[0]
+    x = _x_centered(len(y))
+    return np.dot(x, y) / np.dot(x, x)
+
+
+def _slope_mean_norm(y: np.ndarray) -> float:
+    """Slope of `y` normalized by the mean of `y`."""
+    return _slope(y) / y.mean()
+
+
+def _find_last_crossover(
+    fe: np.ndarray, se: np.ndarray, eps: float, lookback: int
+) -> tuple[int, int]:
+    """
+    Find the most recent fast/slow EMA crossovers within the last bars.
+
+    Parameters
+    ----------
+    fe, se : np.ndarray
+        Fast and slow EMA values.
+    eps : float
+        Tolerance band around the slow EMA.
+    lookback : int
+        Number of most recent bars in which a cross may occur.
+
+    Returns
+    -------
+    tuple of (int, int)
+        Positions in `fe` of the last bullish and last bearish cross, -1 when
+        there is none.
+    """
+    n = min(lookback, len(fe) - 1)
+    if n <= 0:
+        return -1, -1
+    fe_t, se_t = fe[-n - 1 :], se[-n - 1 :]
+    bullish = (fe_t[:-1] <= se_t[:-1] + eps) & (fe_t[1:] > se_t[1:] - eps)
+    bearish = (fe_t[:-1] >= se_t[:-1] - eps) & (fe_t[1:] < se_t[1:] + eps)
+    last = len(fe) - 1
+    return (
+        last - bullish[::-1].argmax() if bullish.any() else -1,
+        last - bearish[::-1].argmax() if bearish.any() else -1,
+    )
+
+
 class SignalGenerator:
     """
     Generates trading signals and confirms them using technical indicators.
@@ -65,52 +120,49 @@ class SignalGenerator:
         confirm_slope_threshold: float = 0.0005,
     ) -> dict:
 
-        last_row_atr = fast_df.iloc[-1]["atr"]
+        fe_arr = fast_df["ema_fast"].to_numpy()
+        se_arr = fast_df["ema_slow"].to_numpy()
+        close_arr = fast_df["close"].to_numpy()
+        last_row_atr = fast_df["atr"].to_numpy()[-1]
         eps = 0.01 * last_row_atr if last_row_atr > 0 else 0.0
 
-        fe = fast_df["ema_fast"]
-        se = fast_df["ema_slow"]
-
-        bullish_mask = (fe.shift(1) <= se.shift(1) + eps) & (fe > se - eps)
-        bearish_mask = (fe.shift(1) >= se.shift(1) - eps) & (fe < se + eps)
-
-        recent_bullish = bullish_mask.tail(lookback_bars)
-        recent_bearish = bearish_mask.tail(lookback_bars)
-
-        signal_type = None
-        cross_idx = None
-        if recent_bullish.any():
+        bullish_pos, bearish_pos = _find_last_crossover(
+            fe_arr, se_arr, eps, lookback_bars
+        )
+        if bullish_pos >= 0:
             signal_type = "bullish"
-            cross_idx = recent_bullish[recent_bullish].index[-1]
-        elif recent_bearish.any():
+            cross_pos = bullish_pos
+        elif bearish_pos >= 0:
             signal_type = "bearish"
-            cross_idx = recent_bearish[recent_bearish].index[-1]
+            cross_pos = bearish_pos
         else:
             return None
 
         if persistence_bars > 0:
-            post = fast_df.loc[cross_idx:].head(persistence_bars + 1)
-            if len(post) >= persistence_bars + 1:
+            post_fe = fe_arr[cross_pos : cross_pos + persistence_bars + 1]
+            post_se = se_arr[cross_pos : cross_pos + persistence_bars + 1]
+            if len(post_fe) >= persistence_bars + 1:
                 if signal_type == "bullish":
-                    if not (post["ema_fast"] > post["ema_slow"]).all():
+                    if not (post_fe > post_se).all():
                         return None
                 elif signal_type == "bearish":
-                    if not (post["ema_fast"] < post["ema_slow"]).all():
+                    if not (post_fe < post_se).all():
                         return None
 
-        if min_delta_k_atr > 0 and "atr" in fast_df.columns:
-            last_row = fast_df.iloc[-1]
-            delta = abs(last_row["ema_fast"] - last_row["ema_slow"])
-            if last_row["atr"] > 0 and delta < min_delta_k_atr * last_row["atr"]:
+        if min_delta_k_atr > 0:
+            delta = abs(fe_arr[-1] - se_arr[-1])
+            if last_row_atr > 0 and delta < min_delta_k_atr * last_row_atr:
                 return None
 
-        s_fast = self.calculate_slope(fe, slope_window_fast)
+        s_fast = self.calculate_slope(fe_arr, slope_window_fast)
         if signal_type == "bullish" and s_fast <= slope_threshold:
             return None
         if signal_type == "bearish" and s_fast >= -slope_threshold:
             return None
 
-        ce = confirm_df["ema_fast"].dropna()
+        ce = confirm_df["ema_fast"].to_numpy()
+        ce = ce[~np.isnan(ce)]
+        conf_s = None
         if len(ce) >= confirm_slope_window:
             conf_s = self.calculate_slope(
                 ce,
@@ -122,24 +174,22 @@ class SignalGenerator:
                 return None
 
         metrics = {
-            "ema_fast_slope": round(
-                float(self.calculate_slope(fe, slope_window_fast)), 6
-            ),
+            "ema_fast_slope": round(float(s_fast), 6),
             "ema_slow_slope": round(
-                float(self.calculate_slope(se, slope_window_fast)), 6
+                float(self.calculate_slope(se_arr, slope_window_fast)), 6
             ),
             "ema_confirm_slope": (
-                round(float(self.calculate_slope(ce, confirm_slope_window)), 6)
-                if len(ce) >= confirm_slope_window
-                else None
+                round(float(conf_s), 6) if conf_s is not None else None
             ),
             "close_slope": round(
-                float(self.calculate_slope(fast_df["close"], slope_window_fast)), 6
+                float(self.calculate_slope(close_arr, slope_window_fast)), 6
             ),
             "ema_separation_pct": round(
-                float(((fe.iloc[-1] - se.iloc[-1]) / se.iloc[-1]) * 100), 6
+                float(((fe_arr[-1] - se_arr[-1]) / se_arr[-1]) * 100), 6
+            ),
+            "ema_fast_acceleration": round(
+                float((fe_arr[-1] - fe_arr[-2]) / ((fe_arr[-1] + fe_arr[-2]) * 0.5)), 6
             ),
-            "ema_fast_acceleration": round(float(self.calculate_slope(fe, 2)), 6),
         }
         return {
             "signal": signal_type,
@@ -167,19 +217,25 @@ class SignalGenerator:
             Dictionary with 'valid': bool and 'direction': str.
         """
         indicator_dictionary = {}
-
-        adx_value = df["adx"].iloc[-1]
-        adx_slope = self.calculate_slope(df["adx"], window=confirmation_slope_window)
+        adx_arr = df["adx"].to_numpy()
+        adx_pos_arr = df["adx_pos"].to_numpy()
+        adx_neg_arr = df["adx_neg"].to_numpy()
+        volume_arr = df["volume"].to_numpy()
+        rsi_arr = df["rsi"].to_numpy()
+        atr_arr = df["atr"].to_numpy()
+
+        adx_value = adx_arr[-1]
+        adx_slope = self.calculate_slope(adx_arr, window=confirmation_slope_window)
         indicator_dictionary["adx_slope"] = adx_slope
         indicator_dictionary["adx"] = round(adx_value, 1)
 
-        di_plus = df["adx_pos"].iloc[-1]
-        di_minus = df["adx_neg"].iloc[-1]
+        di_plus = adx_pos_arr[-1]
+        di_minus = adx_neg_arr[-1]
         di_plus_slope = self.calculate_slope(
-            df["adx_pos"], window=confirmation_slope_window
+            adx_pos_arr, window=confirmation_slope_window
         )
         di_minus_slope = self.calculate_slope(
-            df["adx_neg"], window=confirmation_slope_window
+            adx_neg_arr, window=confirmation_slope_window
         )
         indicator_dictionary["di_plus"] = round(di_plus, 1)
         indicator_dictionary["di_minus"] = round(di_minus, 1)
@@ -187,33 +243,26 @@ class SignalGenerator:
         indicator_dictionary["di_plus_slope"] = round(di_plus_slope, 3)
         indicator_dictionary["di_minus_slope"] = round(di_minus_slope, 3)
 
-        volume = df["volume"].iloc[-1]
-        avg_volume = (
-            df["volume"]
-            .rolling(window=self.confirmation_indicator_window)
-            .mean()
-            .iloc[-1]
-        )
+        volume = volume_arr[-1]
+        avg_volume = volume_arr[-self.confirmation_indicator_window :].mean()
         volume_slope = self.calculate_slope(
-            df["volume"], window=self.confirmation_indicator_window
+            volume_arr, window=self.confirmation_indicator_window
         )
 
         indicator_dictionary["volume"] = round(volume)
         indicator_dictionary["avg_volume"] = round(avg_volume)
         indicator_dictionary["volume_trend_slope"] = round(volume_slope, 4)
 
-        rsi_series = df["rsi"]
-        rsi = rsi_series.iloc[-1]
-        rsi_last = rsi_series.iloc[-confirmation_slope_window:]
-        rsi_last_mean = rsi_last.mean()
+        rsi = rsi_arr[-1]
+        rsi_last_mean = rsi_arr[-confirmation_slope_window:].mean()
         rsi_ratio = rsi / rsi_last_mean
         indicator_dictionary["rsi"] = round(rsi, 1)
         indicator_dictionary["rsi_ratio_to_avg"] = round(rsi_ratio, 4)
 
-        price = df["close"].iloc[-1]
-        atr = df["atr"].iloc[-1]
-        atr_avg = df["atr"].rolling(window=self.atr_window).mean().iloc[-1]
-        atr_slope = self.calculate_slope(df["atr"], window=self.atr_window)
+        price = df["close"].to_numpy()[-1]
+        atr = atr_arr[-1]
+        atr_avg = atr_arr[-self.atr_window :].mean()
+        atr_slope = self.calculate_slope(atr_arr, window=self.atr_window)
         stop_loss_price = (
             (price - self.atr_multiplier * atr)
             if trade_signal == "bullish"
@@ -231,7 +280,7 @@ class SignalGenerator:
 
     @staticmethod
     def calculate_slope(
-        series: pd.Series,
+        series: pd.Series | np.ndarray,
         window: int = 3,
         normalize: Literal["first", "mean", "last", None] = "mean",
     ) -> float:
@@ -240,7 +289,7 @@ class SignalGenerator:
 
         Parameters
         ----------
-        series : pd.Series
+        series : pd.Series or np.ndarray
             Time series data such as RSI, EMA, or price.
         window : int, optional
             Number of most recent points to include in slope calculation. Default is 5.
@@ -261,16 +310,14 @@ class SignalGenerator:
             logging.error("\n\nInsufficient data for slope calculation.\n\n")
             return np.nan
 
-        y = series.iloc[-window:].values
-        x = np.arange(window)
-
-        slope, _, _, _, _ = linregress(x, y)
+        y = np.asarray(series, dtype=np.float64)[-window:]
+        if normalize == "mean":
+            return _slope_mean_norm(y)
 
+        slope = _slope(y)
         if normalize == "first":
             return slope / y[0]
         elif normalize == "last":
             return slope / y[-1]
-        elif normalize == "mean":
-            return slope / np.mean(y)
         else:
             return slope
@@ -7,20 +7,45 @@ and current UTC date.
 
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
 
 PERSONAS_DICTIONARY_PATH = "../storage/configs/personas.json"
 AVAILABLE_SYMBOLS_PATH = "../storage/configs/available_pairs.json"
 
 
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime: float) -> dict:
+    """Parse a JSON file; `mtime` is part of the cache key so edits reload."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _index_personas(path: str, mtime: float) -> dict:
+    """Map persona name to persona object for the file version at `mtime`."""
+    return {
+        persona["name"]: persona
+        for persona in _load_json(path, mtime).get("personas", [])
+    }
+
+
+def _load_personas() -> dict:
+    return _index_personas(
+        PERSONAS_DICTIONARY_PATH, os.path.getmtime(PERSONAS_DICTIONARY_PATH)
+    )
+
+
+def _load_symbols() -> dict:
+    return _load_json(AVAILABLE_SYMBOLS_PATH, os.path.getmtime(AVAILABLE_SYMBOLS_PATH))
+
+
 def get_personas_llm_details(persona_name: str) -> dict | None:
     """Get persona details by persona name."""
-    with open(PERSONAS_DICTIONARY_PATH, "r") as f:
-        personas_data = json.load(f)
-
-    for persona in personas_data.get("personas", []):
-        if persona["name"] == persona_name:
-            return persona["llm_parameters"]
+    persona = _load_personas().get(persona_name)
+    if persona is not None:
+        return persona["llm_parameters"]
 
     logging.warning(f"Persona '{persona_name}' not found in personas data.")
     return {"temperature": 0.7, "top_p": 0.9, "response_style": "concise"}
@@ -29,12 +54,9 @@ def get_personas_llm_details(persona_name: str) -> dict | None:
 def get_persona_by_name(persona_name: str) -> dict | None:
     """Get full persona object by persona name."""
     try:
-        with open(PERSONAS_DICTIONARY_PATH, "r") as f:
-            personas_data = json.load(f)
-
-        for persona in personas_data.get("personas", []):
-            if persona["name"] == persona_name:
-                return persona
+        persona = _load_personas().get(persona_name)
+        if persona is not None:
+            return persona
 
         logging.warning(f"Persona '{persona_name}' not found in personas data.")
         return None
@@ -46,9 +68,7 @@ def get_persona_by_name(persona_name: str) -> dict | None:
 def get_available_symbol_pairs() -> dict:
     """Load available trading symbol pairs from JSON file."""
     try:
-        with open(AVAILABLE_SYMBOLS_PATH, "r") as f:
-            symbols_data = json.load(f)
-        return symbols_data
+        return _load_symbols()
     except Exception as e:
         logging.error(f"Error loading available symbol pairs: {e}")
         return {}
@@ -58,4 +78,5 @@ def current_date_utc():
     """
     Returns the current date (UTC) in formas "YYYY-MM-DD HH:MM:SS".
     """
-    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now.isoformat(sep=" ", timespec="seconds")
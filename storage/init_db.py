@@ -1,7 +1,9 @@
 """
 Initialize the SQLite database with the schema defined in schema.sql.
 
-If the database or tables already exist, they will not be recreated.
+If the database or tables already exist, they will not be recreated; missing
+indexes are added and planner statistics are refreshed with ANALYZE.
+The database is switched to WAL journaling, which persists in the file.
 """
 
 import sqlite3
@@ -11,10 +13,20 @@ import traceback
 DB_PATH = Path("trading.db")
 SCHEMA_PATH = Path("schema.sql")
 
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA foreign_keys=ON;
+"""
+
 try:
     conn = sqlite3.connect(DB_PATH)
+    conn.executescript(PRAGMAS)
     with open(SCHEMA_PATH) as f:
         conn.executescript(f.read())
+    conn.execute("ANALYZE")
     conn.close()
 except Exception as e:
     print(f"Error initializing database: {e}")
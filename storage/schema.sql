@@ -81,4 +81,15 @@ CREATE TABLE IF NOT EXISTS trades (
     FOREIGN KEY (signal_id) REFERENCES signals(id),
     FOREIGN KEY (ai_decision_id) REFERENCES ai_decisions(id),
     FOREIGN KEY (user_config_id) REFERENCES user_config(id)
-);
\ No newline at end of file
+);
+
+CREATE INDEX IF NOT EXISTS idx_trades_sym_entry
+    ON trades(symbol_pair, entry_fill_price, exit_fill_price);
+CREATE INDEX IF NOT EXISTS idx_signals_sym
+    ON signals(symbol_pair, signal_type, processed);
+CREATE INDEX IF NOT EXISTS idx_ai_sym
+    ON ai_decisions(symbol_pair, action, confidence);
+CREATE INDEX IF NOT EXISTS idx_user_config_usage
+    ON user_config(usage, added_at DESC);
+CREATE INDEX IF NOT EXISTS idx_symbol_config_usage
+    ON symbol_config(usage);
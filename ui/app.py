@@ -9,6 +9,7 @@ trading configurations, and informational content to provide a
 comprehensive user experience.
 """
 
+import importlib
 import logging
 import streamlit as st
 import os
@@ -21,7 +22,6 @@ os.environ["USER_AGENT"] = (
 
 from state import init_state
 from sidebar import render_sidebar
-from tabs import about, trading_configs, ai_desk, trades_analysis
 
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -36,11 +36,11 @@ logging.basicConfig(
 )
 logging.info("Test log: Logging setup complete.")
 
-TAB_RENDERERS = {
-    "About": about.render,
-    "Trading Configs": trading_configs.render,
-    "AI Desk": ai_desk.render,
-    "Trades Analysis": trades_analysis.render,
+TAB_MODULES = {
+    "About": "tabs.about",
+    "Trading Configs": "tabs.trading_configs",
+    "AI Desk": "tabs.ai_desk",
+    "Trades Analysis": "tabs.trades_analysis",
 }
 TABS = ["About", "Trading Configs", "Trades Analysis", "AI Desk"]
 INDEX_PATH = os.path.join(
@@ -74,6 +74,11 @@ st.html(
 tab_objs = st.tabs(TABS)
 
 
+def render_tab(name: str) -> None:
+    """Import a tab module on first use and render it."""
+    importlib.import_module(TAB_MODULES[name]).render()
+
+
 for tab, name in zip(tab_objs, TABS):
     with tab:
-        TAB_RENDERERS[name]()
+        render_tab(name)
@@ -1,49 +1,193 @@
 """
 Data access layer for configuration management.
 Provides methods to retrieve and update user and symbol configurations
-from the SQLite database.
+from the SQLite database. Reads go through a read-only connection; a
+read-write connection is opened only when something is written.
 """
 
 import sqlite3 as sql
 import logging
+import pathlib
+import threading
 from common_utils.utils import current_date_utc
 
 
 class ConfigDataAccess:
-    def __init__(self, db_path: str):
+    _Q_CURRENT_CONFIGS = """
+    SELECT * FROM user_config WHERE usage = 1
+    ORDER BY added_at DESC LIMIT 1
+    """
+    _Q_DISCONTINUE_CONFIG = (
+        "UPDATE user_config SET usage = ?, discontinued_at = ? WHERE id = ?"
+    )
+    _Q_INSERT_CONFIG = """
+    INSERT INTO user_config (ai_persona, fast_window, slow_window,
+    confirmation_indicator_window, atr_window, atr_multiplier,
+    usage, added_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _Q_ACTIVE_SYMBOL_CONFIGS = "SELECT * FROM symbol_config WHERE usage = 1"
+    _Q_DISCONTINUE_SYMBOL_CONFIG = (
+        "UPDATE symbol_config SET usage = ?, discontinued_at = ? WHERE id = ?"
+    )
+    _Q_INSERT_SYMBOL_CONFIG = """
+    INSERT INTO symbol_config (symbol_pair, max_allocation,
+    usage, added_at)
+    VALUES (?, ?, ?, ?)
+    """
+    _Q_CURRENT_AND_SYMBOL_CONFIGS = """
+    SELECT * FROM (
+        SELECT 'cfg' AS kind, id, ai_persona, fast_window, slow_window,
+        confirmation_indicator_window, atr_window, atr_multiplier,
+        usage, added_at, discontinued_at
+        FROM user_config WHERE usage = 1
+        ORDER BY added_at DESC LIMIT 1
+    )
+    UNION ALL
+    SELECT 'sym', id, symbol_pair, max_allocation, usage, added_at,
+    discontinued_at, NULL, NULL, NULL, NULL
+    FROM symbol_config WHERE usage = 1
+    """
+
+    def __init__(self, db_path: str, connection: sql.Connection | None = None):
+        """
+        Parameters
+        ----------
+        db_path : str
+            Path to the SQLite database.
+        connection : sqlite3.Connection, optional
+            Existing connection to read through. It is owned by the caller, so
+            connect() and close() leave it untouched.
+        """
         self.db_path = db_path
-        self.connection = None
+        self.connection = connection
+        self._owns_connection = connection is None
+        self._writer = None
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def _apply_pragmas(conn: sql.Connection):
+        """Tune a fresh connection: WAL, relaxed fsync, 20MB cache, memory temp."""
+        conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-20000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA foreign_keys=ON;
+            """
+        )
 
     def connect(self):
+        """Open the read-only connection used by the get_* methods."""
+        if not self._owns_connection:
+            return
         try:
-            self.connection = sql.connect(self.db_path)
+            self.connection = sql.connect(
+                f"{pathlib.Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            self.connection.executescript(
+                """
+                PRAGMA query_only=1;
+                PRAGMA busy_timeout=5000;
+                PRAGMA cache_size=-20000;
+                PRAGMA temp_store=MEMORY;
+                """
+            )
             logging.info("Database connection established.")
         except sql.Error as e:
             logging.error(f"Error connecting to database: {e}")
             raise
 
+    def _writer_connection(self) -> sql.Connection:
+        """
+        Return the read-write connection, opening it on the first write.
+
+        Callers must hold `_write_lock`; an instance may be shared between
+        Streamlit sessions, which run on separate threads.
+        """
+        if self._writer is None:
+            try:
+                self._writer = sql.connect(
+                    self.db_path,
+                    isolation_level=None,
+                    check_same_thread=False,
+                    cached_statements=256,
+                )
+                self._apply_pragmas(self._writer)
+            except sql.Error as e:
+                logging.error(f"Error connecting to database: {e}")
+                raise
+        return self._writer
+
     def close(self):
-        if self.connection:
+        with self._write_lock:
+            if self._writer:
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sql.Error as e:
+                    logging.warning(f"PRAGMA optimize failed: {e}")
+                self._writer.close()
+                self._writer = None
+        if self.connection and self._owns_connection:
             self.connection.close()
             logging.info("Database connection closed.")
 
-    def execute_query(self, query: str, params: tuple = ()):
+    def _fetch(self, query: str, params: tuple = ()):
+        """Run a read-only statement and return all rows, without committing."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
+            result = self.connection.execute(query, params).fetchall()
             logging.info("Query executed successfully.")
-            return cursor.fetchall()
+            return result
         except sql.Error as e:
             logging.error(f"Error executing query: {e}")
             raise
 
-    def get_current_configs(self):
-        query = """
-        SELECT * FROM user_config WHERE usage = 1
-        ORDER BY added_at DESC LIMIT 1
+    def _execute(self, query: str, params: tuple = ()):
+        """
+        Run a write statement in its own BEGIN IMMEDIATE transaction.
+
+        The write lock serializes transactions on the shared writer connection.
         """
-        result = self.execute_query(query)
+        try:
+            with self._write_lock:
+                conn = self._writer_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(query, params)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            logging.info("Query executed successfully.")
+        except sql.Error as e:
+            logging.error(f"Error executing query: {e}")
+            raise
+
+    def _execute_many(self, query: str, rows: list[tuple]):
+        """Run a write statement for many rows in one BEGIN IMMEDIATE transaction."""
+        try:
+            with self._write_lock:
+                conn = self._writer_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(query, rows)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            logging.info("Batch query executed successfully.")
+        except sql.Error as e:
+            logging.error(f"Error executing batch query: {e}")
+            raise
+
+    def get_current_configs(self):
+        result = self._fetch(self._Q_CURRENT_CONFIGS)
         return result[0] if result else None
 
     def update_discontinued_config_by_id(self, config_id: int, params: dict):
@@ -51,8 +195,9 @@ class ConfigDataAccess:
         discontinued_date = params.get("discontinued_date")
         if discontinued_date is None:
             discontinued_date = current_date_utc()
-        query = "UPDATE user_config SET usage = ?, discontinued_at = ? WHERE id = ?"
-        self.execute_query(query, (usage, discontinued_date, config_id))
+        self._execute(
+            self._Q_DISCONTINUE_CONFIG, (usage, discontinued_date, config_id)
+        )
 
     def set_new_config_as_current(self, params: dict):
         usage = 1
@@ -65,12 +210,6 @@ class ConfigDataAccess:
         date_added = params.get("date_added")
         if date_added is None:
             date_added = current_date_utc()
-        query = """
-        INSERT INTO user_config (ai_persona, fast_window, slow_window,
-        confirmation_indicator_window, atr_window, atr_multiplier,
-        usage, added_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
         params = (
             ai_persona,
             fast_window,
@@ -81,20 +220,63 @@ class ConfigDataAccess:
             usage,
             date_added,
         )
-        self.execute_query(query, params)
+        self._execute(self._Q_INSERT_CONFIG, params)
 
     def get_current_active_symbol_configs(self):
-        query = """SELECT * FROM symbol_config WHERE usage = 1"""
-        result = self.execute_query(query)
+        result = self._fetch(self._Q_ACTIVE_SYMBOL_CONFIGS)
         return result if result else []
 
+    def get_current_and_symbol_configs(self):
+        """
+        Fetch the current user config and the active symbol configs at once.
+
+        Returns
+        -------
+        tuple
+            The get_current_configs() row (or None) and the
+            get_current_active_symbol_configs() rows.
+        """
+        config = None
+        symbol_configs = []
+        for kind, *row in self._fetch(self._Q_CURRENT_AND_SYMBOL_CONFIGS):
+            if kind == "cfg":
+                config = tuple(row)
+            else:
+                symbol_configs.append(tuple(row[:6]))
+        return config, symbol_configs
+
     def update_discontinued_symbol_config_by_id(self, symbol_id: int, params: dict):
         usage = 0
         discontinued_date = params.get("discontinued_date")
         if discontinued_date is None:
             discontinued_date = current_date_utc()
-        query = "UPDATE symbol_config SET usage = ?, discontinued_at = ? WHERE id = ?"
-        self.execute_query(query, (usage, discontinued_date, symbol_id))
+        self._execute(
+            self._Q_DISCONTINUE_SYMBOL_CONFIG, (usage, discontinued_date, symbol_id)
+        )
+
+    def update_discontinued_symbol_configs_bulk(
+        self, symbol_ids: list[int], params: dict
+    ):
+        """
+        Discontinue several symbol configs in a single transaction.
+
+        Parameters
+        ----------
+        symbol_ids : list of int
+            Ids of the symbol_config rows to discontinue.
+        params : dict
+            Same as update_discontinued_symbol_config_by_id; the one
+            discontinued_date is applied to every row.
+        """
+        if not symbol_ids:
+            return
+        discontinued_date = params.get("discontinued_date")
+        if discontinued_date is None:
+            discontinued_date = current_date_utc()
+        self._execute_many(
+            self._Q_DISCONTINUE_SYMBOL_CONFIG,
+            [(0, discontinued_date, symbol_id) for symbol_id in symbol_ids],
+        )
 
     def set_new_symbol_config_as_current(self, params: dict):
         usage = 1
@@ -103,15 +285,33 @@ class ConfigDataAccess:
         date_added = params.get("date_added")
         if date_added is None:
             date_added = current_date_utc()
-        query = """
-        INSERT INTO symbol_config (symbol_pair, max_allocation,
-        usage, added_at)
-        VALUES (?, ?, ?, ?)
-        """
         params = (
             symbol_pair,
             max_allocation,
             usage,
             date_added,
         )
-        self.execute_query(query, params)
+        self._execute(self._Q_INSERT_SYMBOL_CONFIG, params)
+
+    def set_new_symbol_configs_bulk(self, params_list: list[dict]):
+        """
+        Insert several current symbol configs in a single transaction.
+
+        Parameters
+        ----------
+        params_list : list of dict
+            One set_new_symbol_config_as_current params dict per symbol.
+        """
+        if not params_list:
+            return
+        now = current_date_utc()
+        rows = [
+            (
+                params.get("symbol_pair"),
+                params.get("max_allocation"),
+                1,
+                params.get("date_added") or now,
+            )
+            for params in params_list
+        ]
+        self._execute_many(self._Q_INSERT_SYMBOL_CONFIG, rows)
@@ -6,16 +6,160 @@ from the SQLite database, along with aggregated metrics.
 
 import sqlite3 as sql
 import logging
+import pathlib
 
 
 class TradeDataAccess:
+    # SQLITE_MAX_VARIABLE_NUMBER default on older builds; IN lists are chunked to it
+    _MAX_VARIABLES = 999
+    _Q_ALL_TRADES = "SELECT * FROM trades"
+    _Q_TRADES_BY_STATUS = "SELECT * FROM trades WHERE order_status = ?"
+    _Q_TRADES_BY_SYMBOL = "SELECT * FROM trades WHERE symbol_pair = ?"
+    _Q_TRADES_BY_STATUSES = "SELECT * FROM trades WHERE order_status IN ({})"
+    _Q_TRADES_BY_SYMBOLS = "SELECT * FROM trades WHERE symbol_pair IN ({})"
+    _Q_ALL_SIGNALS = "SELECT * FROM signals"
+    _Q_DATA_VERSION = """
+    SELECT
+        (SELECT MAX(rowid) FROM trades),
+        (SELECT MAX(rowid) FROM signals),
+        (SELECT MAX(rowid) FROM ai_decisions)
+    """
+    # Per-symbol trade aggregates, shared by the metrics and overview queries.
+    _TRADE_METRICS_SELECT = """
+    SELECT
+        symbol_pair,
+        COUNT(*) as total_trades,
+        SUM(CASE
+            WHEN exit_fill_price IS NOT NULL AND exit_fill_quantity IS NOT NULL
+            THEN (exit_fill_price - entry_fill_price) * exit_fill_quantity
+            ELSE 0
+        END) as total_pnl,
+        AVG(CASE
+            WHEN exit_fill_price IS NOT NULL AND entry_fill_price IS NOT NULL
+                AND entry_fill_price > 0
+            THEN ((exit_fill_price - entry_fill_price) / entry_fill_price) * 100
+            ELSE NULL
+        END) as avg_return_pct,
+        SUM(
+            exit_fill_price IS NOT NULL AND exit_fill_price > entry_fill_price
+        ) * 100.0 / COUNT(*) as win_rate_pct,
+        AVG(quantity * entry_fill_price) as avg_position_size,
+        SUM(exit_fill_price IS NOT NULL) as closed_trades,
+        COUNT(*) - SUM(exit_fill_price IS NOT NULL) as open_trades,
+        AVG(CASE
+            WHEN closed_at IS NOT NULL AND opened_at IS NOT NULL
+            THEN (julianday(closed_at) - julianday(opened_at)) * 24
+            ELSE NULL
+        END) as avg_duration_hours
+    FROM trades
+    WHERE entry_fill_price IS NOT NULL
+    GROUP BY symbol_pair
+    """
+    _Q_TRADE_METRICS = _TRADE_METRICS_SELECT + "ORDER BY symbol_pair"
+    _Q_SIGNAL_METRICS = """
+    SELECT
+        symbol_pair,
+        COUNT(*) as total_signals,
+        SUM(signal_type IS 'buy') as buy_signals,
+        SUM(signal_type IS 'sell') as sell_signals,
+        AVG(price) as avg_signal_price,
+        SUM(processed IS 1) as processed_signals,
+        SUM(processed IS 0) as pending_signals
+    FROM signals
+    GROUP BY symbol_pair
+    ORDER BY symbol_pair
+    """
+    _Q_AI_DECISION_METRICS = """
+    SELECT
+        symbol_pair,
+        COUNT(*) as total_decisions,
+        SUM(action IS 'BUY') as buy_decisions,
+        SUM(action IS 'SELL') as sell_decisions,
+        SUM(action IS 'HOLD') as hold_decisions,
+        AVG(CASE confidence
+            WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1
+        END) as avg_confidence_score,
+        AVG(risk_score) as avg_risk_score,
+        AVG(position_size_pct) as avg_position_size_pct,
+        SUM(confidence IS 'high') as high_confidence_count,
+        SUM(confidence IS 'medium') as medium_confidence_count,
+        SUM(confidence IS 'low') as low_confidence_count
+    FROM ai_decisions
+    GROUP BY symbol_pair
+    ORDER BY symbol_pair
+    """
+    _Q_COMBINED_OVERVIEW = (
+        "WITH t AS ("
+        + _TRADE_METRICS_SELECT
+        + """
+    ),
+    s AS (
+        SELECT symbol_pair, COUNT(*) as total_signals
+        FROM signals
+        GROUP BY symbol_pair
+    ),
+    a AS (
+        SELECT
+            symbol_pair,
+            COUNT(*) as total_decisions,
+            AVG(CASE confidence
+                WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1
+            END) as avg_confidence_score,
+            AVG(risk_score) as avg_risk_score
+        FROM ai_decisions
+        GROUP BY symbol_pair
+    ),
+    symbols AS (
+        SELECT symbol_pair FROM t
+        UNION SELECT symbol_pair FROM s
+        UNION SELECT symbol_pair FROM a
+    )
+    SELECT
+        symbols.symbol_pair,
+        COALESCE(t.total_pnl, 0) as total_pnl,
+        COALESCE(t.avg_return_pct, 0) as avg_return_pct,
+        COALESCE(t.win_rate_pct, 0) as win_rate_pct,
+        COALESCE(t.total_trades, 0) as total_trades,
+        COALESCE(t.avg_position_size, 0) as avg_position_size,
+        COALESCE(t.avg_duration_hours, 0) as avg_duration_hours,
+        COALESCE(t.closed_trades, 0) as closed_trades,
+        COALESCE(s.total_signals, 0) as total_signals,
+        COALESCE(t.total_trades, 0) * 100.0
+            / MAX(COALESCE(s.total_signals, 1), 1) as signal_conversion_rate,
+        COALESCE(a.avg_confidence_score, 0) as avg_confidence_score,
+        COALESCE(a.avg_risk_score, 0) as avg_risk_score,
+        COALESCE(a.total_decisions, 0) as total_decisions
+    FROM symbols
+    LEFT JOIN t ON t.symbol_pair = symbols.symbol_pair
+    LEFT JOIN s ON s.symbol_pair = symbols.symbol_pair
+    LEFT JOIN a ON a.symbol_pair = symbols.symbol_pair
+    ORDER BY symbols.symbol_pair
+    """
+    )
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.connection = None
 
     def connect(self):
+        """Open a read-only connection; the UI never writes trades or signals."""
         try:
-            self.connection = sql.connect(self.db_path)
+            self.connection = sql.connect(
+                f"{pathlib.Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            self.connection.executescript(
+                """
+                PRAGMA query_only=1;
+                PRAGMA busy_timeout=5000;
+                PRAGMA cache_size=-20000;
+                PRAGMA temp_store=MEMORY;
+                """
+            )
+            self.connection.row_factory = sql.Row
             logging.info("Database connection established.")
         except sql.Error as e:
             logging.error(f"Error connecting to database: {e}")
@@ -26,37 +170,64 @@ class TradeDataAccess:
             self.connection.close()
             logging.info("Database connection closed.")
 
-    def execute_query(self, query: str, params: tuple = ()):
+    def _fetch(self, query: str, params: tuple = ()):
+        """Run a read-only statement and return all rows, without committing."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
+            result = self.connection.execute(query, params).fetchall()
             logging.info("Query executed successfully.")
-            return cursor.fetchall()
+            return result
         except sql.Error as e:
             logging.error(f"Error executing query: {e}")
             raise
 
     def get_all_trades(self):
-        query = "SELECT * FROM trades"
-        result = self.execute_query(query)
+        result = self._fetch(self._Q_ALL_TRADES)
         return result
 
     def get_trades_by_status(self, status: str):
-        query = "SELECT * FROM trades WHERE order_status = ?"
-        result = self.execute_query(query, (status,))
+        result = self._fetch(self._Q_TRADES_BY_STATUS, (status,))
         return result
 
     def get_trades_by_symbol(self, symbol: str):
-        query = "SELECT * FROM trades WHERE symbol_pair = ?"
-        result = self.execute_query(query, (symbol,))
+        result = self._fetch(self._Q_TRADES_BY_SYMBOL, (symbol,))
+        return result
+
+    def _fetch_in(self, query: str, values: list) -> list:
+        """
+        Run `query` with its IN (...) placeholder bound to `values`.
+
+        Values are sent in chunks of at most _MAX_VARIABLES, so any list length
+        stays within SQLite's bound-parameter limit.
+        """
+        values = list(dict.fromkeys(values))
+        result = []
+        for start in range(0, len(values), self._MAX_VARIABLES):
+            chunk = values[start : start + self._MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            result.extend(self._fetch(query.format(placeholders), tuple(chunk)))
         return result
 
+    def get_trades_by_statuses(self, statuses: list[str]):
+        """Batched get_trades_by_status: trades whose status is in `statuses`."""
+        return self._fetch_in(self._Q_TRADES_BY_STATUSES, statuses)
+
+    def get_trades_by_symbols(self, symbols: list[str]):
+        """Batched get_trades_by_symbol: trades whose symbol is in `symbols`."""
+        return self._fetch_in(self._Q_TRADES_BY_SYMBOLS, symbols)
+
     def get_all_signals(self):
-        query = "SELECT * FROM signals"
-        result = self.execute_query(query)
+        result = self._fetch(self._Q_ALL_SIGNALS)
         return result
 
+    def get_data_version(self) -> tuple:
+        """
+        Return a cheap token that changes whenever rows are added.
+
+        Used to key cached metric results; the per-table MAX(rowid) lookups are
+        answered from the end of each table's b-tree without a scan.
+        """
+        return tuple(self._fetch(self._Q_DATA_VERSION)[0])
+
     def get_trade_metrics_by_symbol(self):
         """
         Calculate comprehensive trading metrics grouped by symbol pair.
@@ -66,53 +237,9 @@ class TradeDataAccess:
         list
             List of dictionaries with symbol and metric data
         """
-        query = """
-        SELECT
-            symbol_pair,
-            COUNT(*) as total_trades,
-            SUM(CASE
-                WHEN exit_fill_price IS NOT NULL AND exit_fill_quantity IS NOT NULL
-                THEN (exit_fill_price - entry_fill_price) * exit_fill_quantity
-                ELSE 0
-            END) as total_pnl,
-            AVG(CASE
-                WHEN exit_fill_price IS NOT NULL AND entry_fill_price IS NOT NULL AND entry_fill_price > 0
-                THEN ((exit_fill_price - entry_fill_price) / entry_fill_price) * 100
-                ELSE NULL
-            END) as avg_return_pct,
-            SUM(CASE
-                WHEN exit_fill_price > entry_fill_price THEN 1
-                ELSE 0
-            END) * 100.0 / COUNT(*) as win_rate_pct,
-            AVG(quantity * entry_fill_price) as avg_position_size,
-            COUNT(CASE WHEN exit_fill_price IS NOT NULL THEN 1 END) as closed_trades,
-            COUNT(CASE WHEN exit_fill_price IS NULL THEN 1 END) as open_trades,
-            AVG(CASE
-                WHEN closed_at IS NOT NULL AND opened_at IS NOT NULL
-                THEN (julianday(closed_at) - julianday(opened_at)) * 24
-                ELSE NULL
-            END) as avg_duration_hours
-        FROM trades
-        WHERE entry_fill_price IS NOT NULL
-        GROUP BY symbol_pair
-        ORDER BY symbol_pair
-        """
-        result = self.execute_query(query)
+        result = self._fetch(self._Q_TRADE_METRICS)
 
-        # Convert to list of dictionaries for easier handling
-        columns = [
-            "symbol_pair",
-            "total_trades",
-            "total_pnl",
-            "avg_return_pct",
-            "win_rate_pct",
-            "avg_position_size",
-            "closed_trades",
-            "open_trades",
-            "avg_duration_hours",
-        ]
-
-        return [dict(zip(columns, row)) for row in result]
+        return [dict(row) for row in result]
 
     def get_signal_metrics_by_symbol(self):
         """
@@ -123,32 +250,9 @@ class TradeDataAccess:
         list
             List of dictionaries with symbol and signal data
         """
-        query = """
-        SELECT
-            symbol_pair,
-            COUNT(*) as total_signals,
-            SUM(CASE WHEN signal_type = 'buy' THEN 1 ELSE 0 END) as buy_signals,
-            SUM(CASE WHEN signal_type = 'sell' THEN 1 ELSE 0 END) as sell_signals,
-            AVG(price) as avg_signal_price,
-            COUNT(CASE WHEN processed = 1 THEN 1 END) as processed_signals,
-            COUNT(CASE WHEN processed = 0 THEN 1 END) as pending_signals
-        FROM signals
-        GROUP BY symbol_pair
-        ORDER BY symbol_pair
-        """
-        result = self.execute_query(query)
-
-        columns = [
-            "symbol_pair",
-            "total_signals",
-            "buy_signals",
-            "sell_signals",
-            "avg_signal_price",
-            "processed_signals",
-            "pending_signals",
-        ]
+        result = self._fetch(self._Q_SIGNAL_METRICS)
 
-        return [dict(zip(columns, row)) for row in result]
+        return [dict(row) for row in result]
 
     def get_ai_decision_metrics_by_symbol(self):
         """
@@ -159,40 +263,9 @@ class TradeDataAccess:
         list
             List of dictionaries with symbol and AI decision data
         """
-        query = """
-        SELECT
-            symbol_pair,
-            COUNT(*) as total_decisions,
-            SUM(CASE WHEN action = 'BUY' THEN 1 ELSE 0 END) as buy_decisions,
-            SUM(CASE WHEN action = 'SELL' THEN 1 ELSE 0 END) as sell_decisions,
-            SUM(CASE WHEN action = 'HOLD' THEN 1 ELSE 0 END) as hold_decisions,
-            AVG(CASE WHEN confidence = 'high' THEN 3 WHEN confidence = 'medium' THEN 2 WHEN confidence = 'low' THEN 1 END) as avg_confidence_score,
-            AVG(risk_score) as avg_risk_score,
-            AVG(position_size_pct) as avg_position_size_pct,
-            COUNT(CASE WHEN confidence = 'high' THEN 1 END) as high_confidence_count,
-            COUNT(CASE WHEN confidence = 'medium' THEN 1 END) as medium_confidence_count,
-            COUNT(CASE WHEN confidence = 'low' THEN 1 END) as low_confidence_count
-        FROM ai_decisions
-        GROUP BY symbol_pair
-        ORDER BY symbol_pair
-        """
-        result = self.execute_query(query)
-
-        columns = [
-            "symbol_pair",
-            "total_decisions",
-            "buy_decisions",
-            "sell_decisions",
-            "hold_decisions",
-            "avg_confidence_score",
-            "avg_risk_score",
-            "avg_position_size_pct",
-            "high_confidence_count",
-            "medium_confidence_count",
-            "low_confidence_count",
-        ]
+        result = self._fetch(self._Q_AI_DECISION_METRICS)
 
-        return [dict(zip(columns, row)) for row in result]
+        return [dict(row) for row in result]
 
     def get_combined_trading_overview(self):
         """
@@ -203,63 +276,6 @@ class TradeDataAccess:
         list
             List of dictionaries with combined metrics by symbol
         """
-        trade_metrics = {
-            item["symbol_pair"]: item for item in self.get_trade_metrics_by_symbol()
-        }
-        signal_metrics = {
-            item["symbol_pair"]: item for item in self.get_signal_metrics_by_symbol()
-        }
-        ai_metrics = {
-            item["symbol_pair"]: item
-            for item in self.get_ai_decision_metrics_by_symbol()
-        }
-
-        all_symbols = (
-            set(trade_metrics.keys())
-            | set(signal_metrics.keys())
-            | set(ai_metrics.keys())
-        )
-
-        combined_data = []
-        for symbol in all_symbols:
-            combined = {
-                "symbol_pair": symbol,
-                "total_pnl": trade_metrics.get(symbol, {}).get("total_pnl", 0) or 0,
-                "avg_return_pct": trade_metrics.get(symbol, {}).get("avg_return_pct", 0)
-                or 0,
-                "win_rate_pct": trade_metrics.get(symbol, {}).get("win_rate_pct", 0)
-                or 0,
-                "total_trades": trade_metrics.get(symbol, {}).get("total_trades", 0)
-                or 0,
-                "avg_position_size": trade_metrics.get(symbol, {}).get(
-                    "avg_position_size", 0
-                )
-                or 0,
-                "avg_duration_hours": trade_metrics.get(symbol, {}).get(
-                    "avg_duration_hours", 0
-                )
-                or 0,
-                "closed_trades": trade_metrics.get(symbol, {}).get("closed_trades", 0)
-                or 0,
-                "total_signals": signal_metrics.get(symbol, {}).get("total_signals", 0)
-                or 0,
-                "signal_conversion_rate": (
-                    (trade_metrics.get(symbol, {}).get("total_trades", 0) or 0)
-                    * 100.0
-                    / max(
-                        signal_metrics.get(symbol, {}).get("total_signals", 1) or 1, 1
-                    )
-                ),
-    
-                "avg_confidence_score": ai_metrics.get(symbol, {}).get(
-                    "avg_confidence_score", 0
-                )
-                or 0,
-                "avg_risk_score": ai_metrics.get(symbol, {}).get("avg_risk_score", 0)
-                or 0,
-                "total_decisions": ai_metrics.get(symbol, {}).get("total_decisions", 0)
-                or 0,
-            }
-            combined_data.append(combined)
+        result = self._fetch(self._Q_COMBINED_OVERVIEW)
 
-        return combined_data
+        return [dict(row) for row in result]
@@ -30,6 +30,7 @@ from ai.rag.rag_store import (
     add_uploaded_files_to_index,
     add_url_content_to_index,
 )
+from ai.rag.retrievers import load_vectorstore
 from ai.tools.web_load import web_load
 
 load_dotenv()
@@ -43,6 +44,22 @@ DEFAULT_KB = get_knowledge_base_files(
 
 
 PERSONAS_LIST = get_personas_list()
+PERSONA_INDEX = {persona: i for i, persona in enumerate(PERSONAS_LIST)}
+
+
+@st.cache_resource
+def _ensure_faiss(index_path: str, kb_files: tuple[str, ...]) -> str:
+    """
+    Build the default FAISS index if it is missing, once per process.
+
+    cache_resource is process-global and serializes concurrent first calls, so
+    simultaneous sessions never race on a half-written index.
+    """
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    if not os.path.exists(index_path):
+        print("Building FAISS index from default KB...")
+        build_faiss_from_documents(list(kb_files), index_path)
+    return index_path
 
 
 def render_sidebar(index_path: str) -> None:
@@ -54,13 +71,11 @@ def render_sidebar(index_path: str) -> None:
         if not ui_state.api_key:
             st.error("OpenAI API key is required.")
 
-        os.environ["OPENAI_API_KEY"] = ui_state.api_key
+        if os.environ.get("OPENAI_API_KEY") != ui_state.api_key:
+            os.environ["OPENAI_API_KEY"] = ui_state.api_key
         ui_state.api_key_set = True
 
-        os.makedirs("../storage/knowledge_base/var", exist_ok=True)
-        if not os.path.exists(index_path):
-            print("Building FAISS index from default KB...")
-            build_faiss_from_documents(DEFAULT_KB, index_path)
+        _ensure_faiss(index_path, tuple(DEFAULT_KB))
     except Exception as e:
         st.error(f"Initialization failed: {e}")
         traceback.print_exc()
@@ -70,11 +85,7 @@ def render_sidebar(index_path: str) -> None:
         ui_state.ai_persona = st.selectbox(
             "Select Persona",
             PERSONAS_LIST,
-            index=(
-                PERSONAS_LIST.index(ui_state.ai_persona)
-                if ui_state.ai_persona in PERSONAS_LIST
-                else 0
-            ),
+            index=PERSONA_INDEX.get(ui_state.ai_persona, 0),
             help="Select the AI persona for this session",
         )
 
@@ -154,6 +165,13 @@ def render_sidebar(index_path: str) -> None:
                     ui_state.web_uploader_key += 1
                     st.rerun()
 
+        if st.button("Reload Knowledge Base", use_container_width=True):
+            try:
+                load_vectorstore(index_path, reload=True)
+                st.success("✅ Knowledge base reloaded from disk.")
+            except Exception as e:
+                st.error(f"❌ Failed to reload knowledge base: {e}")
+
         st.divider()
 
         with st.expander("💰 Usage & Cost (MOCKUP)", expanded=False):
@@ -13,7 +13,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from datetime import datetime
 import streamlit as st
 import logging
-from pydantic import BaseModel, Field
+import sqlite3 as sql
+from pydantic import BaseModel, ConfigDict, Field
 import pathlib
 
 from common_utils.utils import get_personas_llm_details
@@ -21,7 +22,16 @@ from data_access.configs import ConfigDataAccess
 
 
 class Session(BaseModel):
-    """Session state using Pydantic for consistency."""
+    """
+    Session state using Pydantic for consistency.
+
+    Fields are validated when the session is created; widget values assigned on
+    each rerun are stored as-is to keep the sidebar cheap.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid", arbitrary_types_allowed=True, validate_assignment=False
+    )
 
     ai_persona: str = "Sherlock Holmes"
     response_style: str = "Concise"
@@ -35,15 +45,17 @@ class Session(BaseModel):
     atr_window: int = 14
     atr_multiplier: float = 1.7
 
-    symbol_configs: dict = {
-        "BTC-EUR": 40.0,
-        "ETH-EUR": 30.0,
-        "XRP-EUR": 30.0,
-        "LTC-EUR": 15.0,
-        "SOL-EUR": 20.0,
-        "BNB-EUR": 10.0,
-        "ADA-EUR": 10.0,
-    }
+    symbol_configs: dict[str, float] = Field(
+        default_factory=lambda: {
+            "BTC-EUR": 40.0,
+            "ETH-EUR": 30.0,
+            "XRP-EUR": 30.0,
+            "LTC-EUR": 15.0,
+            "SOL-EUR": 20.0,
+            "BNB-EUR": 10.0,
+            "ADA-EUR": 10.0,
+        }
+    )
 
     api_key: str = ""
     api_key_set: bool = False
@@ -58,8 +70,19 @@ class Session(BaseModel):
     session_start_ts: float = Field(default_factory=lambda: datetime.now().timestamp())
     ai_desk_messages: list = Field(default_factory=list)
 
-    class Config:
-        arbitrary_types_allowed = True
+
+@st.cache_resource
+def _ui_db_conn(db_path: str) -> sql.Connection:
+    """Return one long-lived read-only connection shared by all UI sessions."""
+    conn = sql.connect(
+        f"{pathlib.Path(db_path).resolve().as_uri()}?mode=ro",
+        uri=True,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=256,
+    )
+    conn.executescript("PRAGMA query_only=1; PRAGMA temp_store=MEMORY;")
+    return conn
 
 
 def init_state() -> None:
@@ -69,10 +92,10 @@ def init_state() -> None:
             db_path = str(
                 pathlib.Path(__file__).parent.parent / "storage" / "trading.db"
             )
-            config_obj = ConfigDataAccess(db_path)
-            config_obj.connect()
-            db_config = config_obj.get_current_configs()
-            symbol_configs_table = config_obj.get_current_active_symbol_configs()
+            config_obj = ConfigDataAccess(db_path, connection=_ui_db_conn(db_path))
+            db_config, symbol_configs_table = (
+                config_obj.get_current_and_symbol_configs()
+            )
             symbol_configs = {}
             for symbol_config in symbol_configs_table:
                 (
@@ -85,7 +108,6 @@ def init_state() -> None:
                 ) = symbol_config
                 symbol_configs[symbol_pair] = max_allocation
 
-            config_obj.close()
             print(f"Loaded user config from DB.{db_config}")
         except Exception as e:
             logging.warning(f"Could not load user config from DB: {e}")
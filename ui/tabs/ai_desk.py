@@ -8,9 +8,14 @@ and chat flow management with simple memory management.
 
 import streamlit as st
 import re
-from ai.ai_agent import chat
+from ai.ai_agent import stream_chat
 from ui.state import ui_session_state
 
+CHAT_WINDOW = 30
+MAX_MESSAGES = 100
+HISTORY_MESSAGES = 20
+_WS_RE = re.compile(r"  +")
+
 
 def get_static_greeting() -> str:
     """Return a static greeting message for the AI desk."""
@@ -42,8 +47,7 @@ def format_llm_response(response: str, tools_used: list = None) -> str:
         Formatted response text ready for display
     """
     response = response.replace("$", "\\$")
-    response = re.sub(r"\*\*([^*]+)\*\*", r"**\1**", response)
-    response = re.sub(r"  +", " ", response)
+    response = _WS_RE.sub(" ", response)
 
     if tools_used:
         tools_str = ", ".join(tools_used)
@@ -69,17 +73,26 @@ def render() -> None:
             {"role": "assistant", "content": get_static_greeting(), "tools_used": []}
         ]
 
+    messages = st.session_state.ai_desk_messages
+    window = st.session_state.setdefault("ai_desk_window", CHAT_WINDOW)
+
     transcript = st.container(height=500, border=True)
     with transcript:
-        for message in st.session_state.ai_desk_messages:
+        hidden = len(messages) - window
+        if hidden > 0:
+            if st.button(f"Load {min(hidden, CHAT_WINDOW)} earlier messages"):
+                st.session_state.ai_desk_window = window + CHAT_WINDOW
+                st.rerun()
+        for message in messages[-window:]:
             role = message["role"]
             content = message["content"]
             tools_used = message.get("tools_used", [])
 
             with st.chat_message(role):
                 if role == "assistant":
-                    cleaned_response = format_llm_response(content, tools_used)
-                    st.markdown(cleaned_response)
+                    if "formatted" not in message:
+                        message["formatted"] = format_llm_response(content, tools_used)
+                    st.markdown(message["formatted"])
                 else:
                     st.markdown(content)
 
@@ -89,28 +102,40 @@ def render() -> None:
             {"role": "user", "content": user_text.strip()}
         )
 
-        with st.spinner("Thinking..."):
-            try:
-                result = chat(
-                    user_text.strip(),
-                    ui_state.enable_web_search,
-                    ui_state.ai_persona,
-                )
-                if isinstance(result, tuple):
-                    response, tools_used = result
-                else:
-                    response = result
+        with transcript:
+            with st.chat_message("user"):
+                st.markdown(user_text.strip())
+            with st.chat_message("assistant"):
+                placeholder = st.empty()
+                placeholder.text("Thinking...")
+                buf = []
+                tools_used = []
+                try:
+                    for delta in stream_chat(
+                        user_text.strip(),
+                        ui_state.enable_web_search,
+                        ui_state.ai_persona,
+                        tools_used,
+                        history=messages[-HISTORY_MESSAGES - 1 : -1],
+                    ):
+                        buf.append(delta)
+                        placeholder.text("".join(buf))
+                    response = "".join(buf)
+                except Exception as e:
+                    response = f"Sorry, I encountered an error: {str(e)}"
                     tools_used = []
+                    st.error(f"Error processing your request: {str(e)}")
+                formatted = format_llm_response(response, tools_used)
+                placeholder.markdown(formatted)
 
-                st.session_state.ai_desk_messages.append(
-                    {"role": "assistant", "content": response, "tools_used": tools_used}
-                )
-
-            except Exception as e:
-                error_msg = f"Sorry, I encountered an error: {str(e)}"
-                st.session_state.ai_desk_messages.append(
-                    {"role": "assistant", "content": error_msg, "tools_used": []}
-                )
-                st.error(f"Error processing your request: {str(e)}")
-
-        st.rerun()
+        st.session_state.ai_desk_messages.append(
+            {
+                "role": "assistant",
+                "content": response,
+                "tools_used": tools_used,
+                "formatted": formatted,
+            }
+        )
+        st.session_state.ai_desk_messages = st.session_state.ai_desk_messages[
+            -MAX_MESSAGES:
+        ]
@@ -8,9 +8,64 @@ and AI decision quality metrics.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
+import sqlite3 as sql
 from ui.data_access.trades import TradeDataAccess
-from ui.widgets.charts import create_trades_bar_chart
+
+
+@st.cache_resource
+def _get_trade_dal(db_path: str) -> TradeDataAccess:
+    """Return one connected TradeDataAccess shared across reruns and sessions."""
+    trade_data = TradeDataAccess(db_path)
+    trade_data.connect()
+    return trade_data
+
+
+@st.cache_data(ttl=30)
+def _cached_trading_overview(
+    _trade_data: TradeDataAccess, db_path: str, version: tuple
+) -> pd.DataFrame:
+    """
+    Memoize the combined overview DataFrame per database and data version.
+
+    New rows change `version` and invalidate the entry immediately; the TTL
+    bounds how long in-place updates (e.g. closed trades) can stay hidden.
+    Widget-driven reruns therefore skip both the query and the DataFrame build.
+    """
+    return pd.DataFrame(_trade_data.get_combined_trading_overview())
+
+
+@st.cache_data
+def _performance_insights(rows: tuple) -> tuple[list[str], list[str]]:
+    """
+    Build the best and worst performer lines for the insights section.
+
+    Parameters
+    ----------
+    rows : tuple
+        (symbol_pair, total_pnl, win_rate_pct) per symbol. The values key the
+        cache, so metric-switch reruns reuse the previous result.
+
+    Returns
+    -------
+    tuple of (list of str, list of str)
+        Formatted lines for the top and the poor performers.
+    """
+    df = pd.DataFrame(rows, columns=["symbol_pair", "total_pnl", "win_rate_pct"])
+
+    def _lines(performers: pd.DataFrame) -> list[str]:
+        return [
+            f"• {row.symbol_pair}: €{row.total_pnl:,.1f} "
+            f"PnL ({row.win_rate_pct:.1f}% win rate)"
+            for row in performers.itertuples(index=False)
+        ]
+
+    top_performers = df.nlargest(3, "total_pnl")
+    poor_performers = df.query("total_pnl < 0 or win_rate_pct < 50").nsmallest(
+        3, "total_pnl"
+    )
+    return _lines(top_performers), _lines(poor_performers)
 
 
 def render():
@@ -34,17 +89,23 @@ def render():
 
         db_path = os.path.join(project_root, "storage", "trading.db")
 
-        trade_data = TradeDataAccess(db_path)
-        trade_data.connect()
+        trade_data = _get_trade_dal(db_path)
+        try:
+            version = trade_data.get_data_version()
+        except sql.ProgrammingError:
+            _get_trade_dal.clear()
+            trade_data = _get_trade_dal(db_path)
+            version = trade_data.get_data_version()
 
-        trading_data = trade_data.get_combined_trading_overview()
+        df = _cached_trading_overview(trade_data, db_path, version)
 
-        if not trading_data:
+        if df.empty:
             st.warning("No trading data found. Start trading to see analysis here.")
-            trade_data.close()
             return
 
-        _display_summary_metrics(trading_data)
+        from ui.widgets.charts import MAX_BARS, create_trades_bar_chart
+
+        _display_summary_metrics(df)
 
         st.markdown("---")
 
@@ -76,13 +137,19 @@ def render():
             show_table = st.checkbox("Show Detailed Table", value=True)
 
         with col1:
-            df = pd.DataFrame(trading_data)
-            df_filtered = df[df[selected_metric].notna() & (df[selected_metric] != 0)]
+            values = df[selected_metric].to_numpy(dtype=float)
+            df_filtered = df.iloc[np.flatnonzero(~np.isnan(values) & (values != 0))]
 
             chart_title = f"Trading Performance: {selected_metric_label}"
-            chart_subtitle = (
-                f"Performance analysis across {len(df_filtered)} symbol pairs"
-            )
+            if len(df_filtered) > MAX_BARS:
+                chart_subtitle = (
+                    f"Performance analysis of {MAX_BARS} of "
+                    f"{len(df_filtered)} symbol pairs"
+                )
+            else:
+                chart_subtitle = (
+                    f"Performance analysis across {len(df_filtered)} symbol pairs"
+                )
 
             fig = create_trades_bar_chart(
                 df_filtered, selected_metric, chart_title, chart_subtitle
@@ -92,65 +159,51 @@ def render():
 
         if show_table:
             st.markdown("---")
-            _display_detailed_table(trading_data)
+            _display_detailed_table(df)
 
         if len(df) > 0:
             st.markdown("---")
             st.subheader("💡 Performance Insights")
 
+            top_lines, poor_lines = _performance_insights(
+                tuple(
+                    df[["symbol_pair", "total_pnl", "win_rate_pct"]].itertuples(
+                        index=False, name=None
+                    )
+                )
+            )
             insights_col1, insights_col2 = st.columns(2)
 
             with insights_col1:
                 st.markdown("**🎯 Best Performing Symbols:**")
-                top_performers = df.nlargest(3, "total_pnl")[
-                    ["symbol_pair", "total_pnl", "win_rate_pct"]
-                ]
-                for _, row in top_performers.iterrows():
-                    st.write(
-                        f"• {row['symbol_pair']}: €{row['total_pnl']:,.1f} "
-                        f"PnL ({row['win_rate_pct']:.1f}% win rate)"
-                    )
+                st.markdown("  \n".join(top_lines))
 
             with insights_col2:
                 st.markdown("**⚠️ Areas for Improvement:**")
 
-                poor_performers = df[
-                    (df["total_pnl"] < 0) | (df["win_rate_pct"] < 50)
-                ].nsmallest(3, "total_pnl")[
-                    ["symbol_pair", "total_pnl", "win_rate_pct"]
-                ]
-
-                if len(poor_performers) > 0:
-                    for _, row in poor_performers.iterrows():
-                        st.write(
-                            f"• {row['symbol_pair']}: €{row['total_pnl']:,.1f} "
-                            f"PnL ({row['win_rate_pct']:.1f}% win rate)"
-                        )
+                if poor_lines:
+                    st.markdown("  \n".join(poor_lines))
                 else:
                     st.write("• All symbols showing positive performance! 🎉")
 
-        trade_data.close()
-
     except Exception as e:
         st.error(f"Error loading trading data: {str(e)}")
         st.info("Make sure the trading database exists and contains data.")
 
 
-def _display_summary_metrics(data: list):
+def _display_summary_metrics(df: pd.DataFrame):
     """
     Display summary trading metrics in a card layout.
 
     Parameters
     ----------
-    data : list
-        List of trading metrics dictionaries
+    df : pd.DataFrame
+        Trading metrics, one row per symbol pair
     """
-    if not data:
+    if df.empty:
         st.warning("No trading data available for analysis.")
         return
 
-    df = pd.DataFrame(data)
-
     total_pnl = df["total_pnl"].sum()
     total_trades = df["total_trades"].sum()
     avg_win_rate = (
@@ -192,20 +245,18 @@ def _display_summary_metrics(data: list):
         )
 
 
-def _display_detailed_table(data: list):
+def _display_detailed_table(df: pd.DataFrame):
     """
     Display detailed trading metrics in a sortable table.
 
     Parameters
     ----------
-    data : list
-        List of trading metrics dictionaries
+    df : pd.DataFrame
+        Trading metrics, one row per symbol pair
     """
-    if not data:
+    if df.empty:
         return
 
-    df = pd.DataFrame(data)
-
     display_columns = {
         "symbol_pair": "Symbol",
         "total_pnl": "Total PnL (€)",
@@ -223,19 +274,20 @@ def _display_detailed_table(data: list):
     df_display = df[list(available_columns.keys())].copy()
     df_display.columns = list(available_columns.values())
     numeric_formats = {
-        "Total PnL (€)": "{:,.1f}",
-        "Avg Return (%)": "{:.1f}",
-        "Win Rate (%)": "{:.1f}",
-        "Conversion (%)": "{:.1f}",
-        "Confidence": "{:.2f}",
-        "Risk Score": "{:.2f}",
+        "Total PnL (€)": "localized",
+        "Avg Return (%)": "%.1f",
+        "Win Rate (%)": "%.1f",
+        "Conversion (%)": "%.1f",
+        "Confidence": "%.2f",
+        "Risk Score": "%.2f",
+    }
+    column_config = {
+        col: st.column_config.NumberColumn(col, format=fmt)
+        for col, fmt in numeric_formats.items()
+        if col in df_display.columns
     }
-
-    for col, fmt in numeric_formats.items():
-        if col in df_display.columns:
-            df_display[col] = df_display[col].apply(
-                lambda x: fmt.format(x) if pd.notnull(x) else "-"
-            )
 
     st.subheader("📊 Detailed Trading Metrics")
-    st.dataframe(df_display, width="stretch", hide_index=True)
+    st.dataframe(
+        df_display, width="stretch", hide_index=True, column_config=column_config
+    )
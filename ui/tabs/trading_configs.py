@@ -10,12 +10,21 @@ and strategies.
 
 import streamlit as st
 import pathlib
+import sqlite3 as sql
 from state import ui_session_state
 from data_access.configs import ConfigDataAccess
 from utils import get_personas_list
 from common_utils.utils import get_personas_llm_details, get_available_symbol_pairs
 
 
+@st.cache_resource
+def _get_config_dal(db_path: str) -> ConfigDataAccess:
+    """Return one connected ConfigDataAccess shared across reruns and sessions."""
+    config_obj = ConfigDataAccess(db_path)
+    config_obj.connect()
+    return config_obj
+
+
 def render():
     ui_state = ui_session_state()
     st.subheader("Select Trading Agent Persona")
@@ -96,8 +105,12 @@ def render():
         st.caption(
             "List of symbol pairs with their respective maximum allocation percentages."
         )
-        for symbol_pair, max_allocation in symbol_configs.items():
-            st.markdown(f"- **{symbol_pair}**: {max_allocation}")
+        st.markdown(
+            "\n".join(
+                f"- **{symbol_pair}**: {max_allocation}"
+                for symbol_pair, max_allocation in symbol_configs.items()
+            )
+        )
         st.write("")
     else:
         st.info("No symbol configurations set yet.")
@@ -161,8 +174,7 @@ def render():
         db_path = str(
             pathlib.Path(__file__).parent.parent.parent / "storage" / "trading.db"
         )
-        config_obj = ConfigDataAccess(db_path)
-        config_obj.connect()
+        config_obj = _get_config_dal(db_path)
 
         new_user_config_params = {
             "ai_persona": bot_ai_persona,
@@ -174,7 +186,12 @@ def render():
             "date_added": None,
         }
 
-        previous_config = config_obj.get_current_configs()
+        try:
+            previous_config = config_obj.get_current_configs()
+        except sql.ProgrammingError:
+            _get_config_dal.clear()
+            config_obj = _get_config_dal(db_path)
+            previous_config = config_obj.get_current_configs()
         if previous_config:
             (
                 id,
@@ -192,27 +209,20 @@ def render():
         config_obj.set_new_config_as_current(new_user_config_params)
 
         previous_symbol_configs_table = config_obj.get_current_active_symbol_configs()
-        if previous_symbol_configs_table:
-            for symbol_config in previous_symbol_configs_table:
-                (
-                    id,
-                    symbol_pair,
-                    max_allocation,
-                    _usage,
-                    _added_at,
-                    _discontinued_at,
-                ) = symbol_config
-                config_obj.update_discontinued_symbol_config_by_id(
-                    id, {"discontinued_date": None}
-                )
-
-        for symbol_pair, max_allocation in symbol_configs.items():
-            symbol_config_params = {
-                "symbol_pair": symbol_pair,
-                "max_allocation": max_allocation,
-                "date_added": None,
-            }
-            config_obj.set_new_symbol_config_as_current(symbol_config_params)
-
-        config_obj.close()
+        config_obj.update_discontinued_symbol_configs_bulk(
+            [symbol_config[0] for symbol_config in previous_symbol_configs_table],
+            {"discontinued_date": None},
+        )
+
+        config_obj.set_new_symbol_configs_bulk(
+            [
+                {
+                    "symbol_pair": symbol_pair,
+                    "max_allocation": max_allocation,
+                    "date_added": None,
+                }
+                for symbol_pair, max_allocation in symbol_configs.items()
+            ]
+        )
+
         st.success("Trading configuration updated in session.")
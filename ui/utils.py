@@ -8,6 +8,8 @@ retrieving knowledge base files, and extracting persona information.
 import glob
 import os
 import json
+from functools import lru_cache
+import streamlit as st
 
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,21 +21,27 @@ PERSONAS_DICTIONARY_PATH = os.path.join(
 
 def format_duration(seconds: float) -> str:
     """Format duration from seconds to 'Xh Ym Zs'."""
-    seconds = max(0, int(seconds))
+    return _format_whole_seconds(max(0, int(seconds)))
+
+
+@lru_cache(maxsize=2048)
+def _format_whole_seconds(seconds: int) -> str:
     h, rem = divmod(seconds, 3600)
     m, s = divmod(rem, 60)
     return f"{h}h {m:02d}m {s:02d}s" if h else f"{m}m {s:02d}s"
 
 
+@st.cache_data(ttl=None)
 def get_knowledge_base_files(base_patterns: list[str]) -> list[str]:
     """Get relevant markdown files for RAG indexing."""
-    files = []
+    files = {}
     for pattern in base_patterns:
-        files.extend(glob.glob(pattern))
+        files.update(dict.fromkeys(glob.glob(pattern)))
 
-    return [f for f in files if os.path.exists(f)]
+    return list(files)
 
 
+@st.cache_data(ttl=None)
 def get_personas_list() -> list[str]:
     """Extract list of persona names from personas data."""
     with open(PERSONAS_DICTIONARY_PATH, "r") as f:
@@ -5,6 +5,14 @@ This module provides chart functions specifically for trading performance analys
 using Plotly with consistent styling and professional visualization.
 """
 
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
@@ -17,16 +25,90 @@ PASTEL_COLORS_RGB = {
     "neutral_grey": "rgb(179, 179, 179)",
 }
 
+_GREEN = PASTEL_COLORS_RGB["leafy_green"]
+_ORANGE = PASTEL_COLORS_RGB["coral_orange"]
+_AQUA = PASTEL_COLORS_RGB["aqua_blue"]
+
 pastel_colors = list(PASTEL_COLORS_RGB.values())
 pio.templates["plotly_dark"].layout.colorway = pastel_colors
 pio.templates.default = "plotly_dark"
 
+_Y_TITLES = MappingProxyType(
+    {
+        "total_pnl": "Total PnL ($)",
+        "avg_return_pct": "Average Return (%)",
+        "win_rate_pct": "Win Rate (%)",
+        "total_trades": "Number of Trades",
+        "avg_position_size": "Average Position Size ($)",
+        "avg_duration_hours": "Average Trade Duration (Hours)",
+        "total_signals": "Number of Signals",
+        "signal_conversion_rate": "Signal Conversion Rate (%)",
+        "avg_confidence_score": "Average Confidence Score",
+        "avg_risk_score": "Average Risk Score",
+        "closed_trades": "Closed Trades Count",
+    }
+)
+
+# (metric substring, (bar label formatter, hover format)); first match wins.
+_FMT_RULES = (
+    ("pnl", ("${:,.0f}".format, "$%{y:,.0f}")),
+    ("pct", ("{:.1f}%".format, "%{y:.1f}%")),
+    ("rate", ("{:.1f}%".format, "%{y:.1f}%")),
+    ("score", ("{:.2f}".format, "%{y:.2f}")),
+    ("hours", ("{:.1f}h".format, "%{y:.1f}h")),
+)
+_DEFAULT_FMT = ("{:.0f}".format, "%{y:.0f}")
+_HOVER_TEMPLATES: dict[tuple[str, str], str] = {}
+
+MAX_BARS = 50
+# Metrics that can be negative; their biggest losers must stay visible.
+_SIGNED_KEYWORDS = ("pnl", "return")
+_CHART_CACHE_SIZE = 64
+_chart_cache: OrderedDict = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+_BASE_LAYOUT = dict(
+    margin=dict(l=60, r=60, t=100, b=60),
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="white"),
+    xaxis=dict(
+        gridcolor="rgba(128, 128, 128, 0.2)",
+        showgrid=True,
+        zeroline=False,
+    ),
+    yaxis=dict(
+        gridcolor="rgba(128, 128, 128, 0.2)",
+        showgrid=True,
+        zeroline=False,
+    ),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1,
+        bgcolor="rgba(0,0,0,0.5)",
+    ),
+)
+
+
+def _title_spec(title: str, subtitle: str) -> dict:
+    """Return the layout title dict shared by all charts."""
+    return dict(
+        text=f"<b>{title}</b><br><span style='font-size:14px;'>{subtitle}</span>",
+        x=0.5,
+        font=dict(size=18),
+    )
+
 
 def _apply_standard_layout(
     fig: go.Figure,
     title: str,
     subtitle: str = "",
     show_legend: bool = True,
+    xaxis_extra: dict | None = None,
+    yaxis_extra: dict | None = None,
 ) -> None:
     """
     Apply consistent styling to all charts.
@@ -41,45 +123,67 @@ def _apply_standard_layout(
         Chart subtitle
     show_legend : bool
         Whether to show legend
+    xaxis_extra, yaxis_extra : dict, optional
+        Axis properties merged over the standard x/y axis styling
     """
     fig.update_layout(
-        title=dict(
-            text=f"<b>{title}</b><br><span style='font-size:14px;'>{subtitle}</span>",
-            x=0.5,
-            font=dict(size=18),
-        ),
+        title=_title_spec(title, subtitle),
         showlegend=show_legend,
-        margin=dict(l=60, r=60, t=100, b=60),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="white"),
-        xaxis=dict(
-            gridcolor="rgba(128, 128, 128, 0.2)",
-            showgrid=True,
-            zeroline=False,
-        ),
-        yaxis=dict(
-            gridcolor="rgba(128, 128, 128, 0.2)",
-            showgrid=True,
-            zeroline=False,
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            bgcolor="rgba(0,0,0,0.5)",
-        ),
+        **{
+            **_BASE_LAYOUT,
+            "xaxis": {**_BASE_LAYOUT["xaxis"], **(xaxis_extra or {})},
+            "yaxis": {**_BASE_LAYOUT["yaxis"], **(yaxis_extra or {})},
+        },
     )
 
 
+def _build_empty_fig_dict() -> dict:
+    """Build the styled "no data" figure once, without title or template."""
+    fig = go.Figure()
+    fig.add_annotation(
+        text="No trading data available",
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False,
+        font=dict(size=16, color="gray"),
+    )
+    _apply_standard_layout(fig, "", "", show_legend=False)
+    fig_dict = fig.to_dict()
+    fig_dict["layout"].pop("title", None)
+    fig_dict["layout"].pop("template", None)
+    return fig_dict
+
+
+_EMPTY_FIG_DICT = _build_empty_fig_dict()
+
+
+def _frame_fingerprint(df: pd.DataFrame, metric: str) -> int | None:
+    """Hash the plotted columns of `df`; None for an empty frame."""
+    if df.empty:
+        return None
+    row_hashes = pd.util.hash_pandas_object(df[["symbol_pair", metric]], index=False)
+    return hash(row_hashes.to_numpy().tobytes())
+
+
 def create_trades_bar_chart(
-    df: pd.DataFrame, metric: str, title: str, subtitle: str
+    df: pd.DataFrame,
+    metric: str,
+    title: str,
+    subtitle: str,
+    show_bar_labels: bool = True,
 ) -> go.Figure:
     """
     Create a customized bar chart for trading metrics using professional styling.
 
+    At most MAX_BARS bars are drawn: the largest values of `metric`, or for
+    signed metrics (PnL, returns) the largest magnitudes, so the biggest
+    losers stay visible.
+    Figures are memoized (LRU, _CHART_CACHE_SIZE entries) on the arguments and
+    a hash of the plotted columns, so reruns with unchanged data skip the
+    rebuild. The returned figure is shared and must not be mutated.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -90,6 +194,126 @@ def create_trades_bar_chart(
         Chart title
     subtitle : str
         Chart subtitle
+    show_bar_labels : bool
+        Whether to print the formatted value above each bar
+
+    Returns
+    -------
+    go.Figure
+        Styled Plotly figure
+    """
+    key = (
+        metric,
+        title,
+        subtitle,
+        show_bar_labels,
+        _frame_fingerprint(df, metric),
+    )
+    with _chart_cache_lock:
+        fig = _chart_cache.get(key)
+        if fig is not None:
+            _chart_cache.move_to_end(key)
+            return fig
+
+    fig = _build_trades_bar_chart(df, metric, title, subtitle, show_bar_labels)
+    with _chart_cache_lock:
+        _chart_cache[key] = fig
+        _chart_cache.move_to_end(key)
+        while len(_chart_cache) > _CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return fig
+
+
+def create_bar_chart_batch(
+    df: pd.DataFrame,
+    specs: list[tuple[str, str, str]],
+    show_bar_labels: bool = True,
+) -> list[go.Figure]:
+    """
+    Build several trades bar charts from one DataFrame concurrently.
+
+    The figure cache is lock-guarded, so the builds can share it; `df` must
+    not be mutated while the batch runs.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with 'symbol_pair' and every metric column in `specs`
+    specs : list of tuple
+        (metric, title, subtitle) per chart
+    show_bar_labels : bool
+        Passed to create_trades_bar_chart for every chart
+
+    Returns
+    -------
+    list of go.Figure
+        Figures in the order of `specs`
+    """
+    if not specs:
+        return []
+    max_workers = min(len(specs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda spec: create_trades_bar_chart(
+                    df, *spec, show_bar_labels=show_bar_labels
+                ),
+                specs,
+            )
+        )
+
+
+def create_trades_bar_chart_json(
+    df: pd.DataFrame,
+    metric: str,
+    title: str,
+    subtitle: str,
+    show_bar_labels: bool = True,
+) -> bytes:
+    """
+    Return create_trades_bar_chart's figure as gzip-compressed JSON.
+
+    Meant for serving the figure over HTTP; the response must carry
+    `Content-Encoding: gzip` so the browser inflates it.
+
+    Parameters
+    ----------
+    df, metric, title, subtitle, show_bar_labels
+        As for create_trades_bar_chart
+
+    Returns
+    -------
+    bytes
+        Gzipped UTF-8 figure JSON
+    """
+    fig = create_trades_bar_chart(
+        df, metric, title, subtitle, show_bar_labels=show_bar_labels
+    )
+    return gzip.compress(fig.to_json().encode("utf-8"), compresslevel=6)
+
+
+def _build_trades_bar_chart(
+    df: pd.DataFrame,
+    metric: str,
+    title: str,
+    subtitle: str,
+    show_bar_labels: bool = True,
+) -> go.Figure:
+    """
+    Build the bar chart behind create_trades_bar_chart, uncached.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with 'symbol_pair' and the selected metric column
+    metric : str
+        The column name for the metric to display on y-axis
+    title : str
+        Chart title
+    subtitle : str
+        Chart subtitle
+    show_bar_labels : bool
+        Whether to print the formatted value above each bar
 
     Returns
     -------
@@ -97,67 +321,59 @@ def create_trades_bar_chart(
         Styled Plotly figure
     """
     if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No trading data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=16, color="gray"),
+        return go.Figure(
+            {
+                **_EMPTY_FIG_DICT,
+                "layout": {
+                    **_EMPTY_FIG_DICT["layout"],
+                    "title": _title_spec(title, subtitle),
+                },
+            }
         )
-        _apply_standard_layout(fig, title, subtitle, show_legend=False)
-        return fig
 
+    if not isinstance(df["symbol_pair"].dtype, pd.CategoricalDtype):
+        df = df.assign(symbol_pair=df["symbol_pair"].astype("category"))
+    metric_l = metric.lower()
+    if len(df) > MAX_BARS:
+        if any(keyword in metric_l for keyword in _SIGNED_KEYWORDS):
+            magnitude = np.abs(df[metric].to_numpy(dtype=np.float64))
+            df = df.iloc[np.argsort(-magnitude, kind="stable")[:MAX_BARS]]
+        else:
+            df = df.nlargest(MAX_BARS, metric)
     df_sorted = df.sort_values(metric, ascending=False)
 
-    if any(keyword in metric.lower() for keyword in ["pnl", "return", "win_rate"]):
-        colors = [
-            (
-                PASTEL_COLORS_RGB["leafy_green"]
-                if val >= 0
-                else PASTEL_COLORS_RGB["coral_orange"]
-            )
-            for val in df_sorted[metric]
-        ]
-    else:
-        colors = [PASTEL_COLORS_RGB["aqua_blue"]] * len(df_sorted)
-
-    fig = go.Figure()
+    values = df_sorted[metric]
+    vals = np.ascontiguousarray(values.to_numpy(), dtype=np.float64)
 
-    if "pnl" in metric.lower():
-        text_values = [f"${val:,.0f}" for val in df_sorted[metric]]
-        hover_format = "$%{y:,.0f}"
-    elif "pct" in metric or "rate" in metric:
-        text_values = [f"{val:.1f}%" for val in df_sorted[metric]]
-        hover_format = "%{y:.1f}%"
-    elif "score" in metric:
-        text_values = [f"{val:.2f}" for val in df_sorted[metric]]
-        hover_format = "%{y:.2f}"
-    elif "hours" in metric:
-        text_values = [f"{val:.1f}h" for val in df_sorted[metric]]
-        hover_format = "%{y:.1f}h"
+    if any(keyword in metric_l for keyword in ["pnl", "return", "win_rate"]):
+        colors = np.where(vals >= 0, _GREEN, _ORANGE).tolist()
     else:
-        text_values = [f"{val:.0f}" for val in df_sorted[metric]]
-        hover_format = "%{y:.0f}"
-
-    fig.add_trace(
-        go.Bar(
-            x=df_sorted["symbol_pair"],
-            y=df_sorted[metric],
-            marker=dict(color=colors),
-            text=text_values,
-            textposition="outside",
-            hovertemplate=f"%{{x}}<br>{metric}: {hover_format}<extra></extra>",
-        )
+        colors = _AQUA
+
+    formatter, hover_format = next(
+        (rule for key, rule in _FMT_RULES if key in metric_l), _DEFAULT_FMT
     )
+    hover_template = _HOVER_TEMPLATES.get((metric, hover_format))
+    if hover_template is None:
+        hover_template = _HOVER_TEMPLATES.setdefault(
+            (metric, hover_format),
+            f"%{{x}}<br>{metric}: {hover_format}<extra></extra>",
+        )
 
-    _apply_standard_layout(fig, title, subtitle, show_legend=False)
-    fig.update_xaxes(title_text="Symbol Pair", tickangle=45)
+    trace = {
+        "type": "bar",
+        "x": df_sorted["symbol_pair"].astype(str).tolist(),
+        "y": vals,
+        "marker": {"color": colors},
+        "hovertemplate": hover_template,
+    }
+    if show_bar_labels:
+        trace["text"] = values.map(formatter).tolist()
+        trace["textposition"] = "outside"
+
+    fig = go.Figure(data=[trace])
 
-    y_max = df_sorted[metric].max()
-    y_min = df_sorted[metric].min()
+    y_min, y_max = np.nanmin(vals), np.nanmax(vals)
     y_range = y_max - y_min
 
     padding_top = y_range * 0.2 if y_range > 0 else abs(y_max) * 0.2
@@ -166,21 +382,14 @@ def create_trades_bar_chart(
     y_axis_min = y_min - padding_bottom
     y_axis_max = y_max + padding_top
 
-    y_titles = {
-        "total_pnl": "Total PnL ($)",
-        "avg_return_pct": "Average Return (%)",
-        "win_rate_pct": "Win Rate (%)",
-        "total_trades": "Number of Trades",
-        "avg_position_size": "Average Position Size ($)",
-        "avg_duration_hours": "Average Trade Duration (Hours)",
-        "total_signals": "Number of Signals",
-        "signal_conversion_rate": "Signal Conversion Rate (%)",
-        "avg_confidence_score": "Average Confidence Score",
-        "avg_risk_score": "Average Risk Score",
-        "closed_trades": "Closed Trades Count",
-    }
-
-    y_title = y_titles.get(metric, metric.replace("_", " ").title())
-    fig.update_yaxes(title_text=y_title, range=[y_axis_min, y_axis_max])
+    y_title = _Y_TITLES.get(metric) or metric.replace("_", " ").title()
+    _apply_standard_layout(
+        fig,
+        title,
+        subtitle,
+        show_legend=False,
+        xaxis_extra={"title": {"text": "Symbol Pair"}, "tickangle": 45},
+        yaxis_extra={"title": {"text": y_title}, "range": [y_axis_min, y_axis_max]},
+    )
 
     return fig